@@ -5,20 +5,34 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 # Ensure src/ is importable when this script is executed from the repo root.
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from sec_downloader import EdgarClient, FilingDownload, FilingSearch
-from sec_downloader.models import DownloadConfig, DownloadResult, Filing, SearchFilters
-from sec_downloader.utils import validate_date_range
-
-import render_viewer_to_xlsx as renderer
+# The downloader pulls in requests/tqdm; import it where it is used so --help and
+# argument errors return immediately. Annotations only need the names.
+if TYPE_CHECKING:
+    from sec_downloader import FilingDownload, FilingSearch
+    from sec_downloader.models import DownloadConfig, DownloadResult, Filing
 
 
 logger = logging.getLogger(__name__)
@@ -41,10 +55,9 @@ def setup_logging(verbose: bool) -> None:
 
 def read_identifier_file(file_path: Path) -> List[str]:
     """Read ticker/CIK identifiers from a file."""
-    with file_path.open("r", encoding="utf-8") as handle:
-        return [
-            line.strip() for line in handle if line.strip() and not line.startswith("#")
-        ]
+    # A single read + C-level splitlines beats iterating the text wrapper per line
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -167,9 +180,25 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         type=Path,
         help="Custom temp directory for Arelle processing",
     )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=2,
+        help="Filings rendered concurrently, each in its own Arelle process (default: 2)",
+    )
     parser.add_argument(
         "--keep-temp", action="store_true", help="Preserve temporary render artifacts"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for cached viewer data (default: ~/.cache/sec_extractor/viewer)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run Arelle instead of reusing cached viewer data",
+    )
     parser.add_argument(
         "--dump-role-map", type=Path, help="Write MetaLinks role metadata to CSV"
     )
@@ -201,15 +230,12 @@ def normalize_identifiers(args: argparse.Namespace) -> List[str]:
     if args.input_file:
         identifiers.extend(read_identifier_file(args.input_file))
 
-    unique_identifiers = []
-    seen = set()
+    # Case-insensitive dedupe that keeps the first spelling seen, in input order
+    unique_identifiers: Dict[str, str] = {}
     for identifier in identifiers:
-        key = identifier.upper()
-        if key not in seen:
-            unique_identifiers.append(identifier)
-            seen.add(key)
+        unique_identifiers.setdefault(identifier.upper(), identifier)
 
-    return unique_identifiers
+    return list(unique_identifiers.values())
 
 
 def build_form_requests(args: argparse.Namespace) -> List[Tuple[str, int]]:
@@ -231,36 +257,72 @@ def parse_date_string(date_str: Optional[str]) -> Optional[datetime]:
         raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD") from exc
 
 
-def make_render_namespace(
+def build_render_template(args: argparse.Namespace) -> Dict[str, Any]:
+    """Collect the renderer options that stay constant for every filing in a run."""
+    return {
+        "one_period": args.one_period,
+        "periods": args.periods,
+        "currency": args.currency,
+        "scale_none": args.scale_none,
+        "scale_millions": not args.scale_none,
+        "include_disclosures": args.include_disclosures,
+        "dump_role_map": args.dump_role_map,
+        "label_style": args.label_style,
+        "expand_dimensions": not args.collapse_dimensions,
+        "no_scale_hint": args.no_scale_hint,
+        "save_viewer_json": args.save_viewer_json,
+        "verbose": args.verbose,
+        "temp_dir": args.render_temp_dir,
+        "keep_temp": args.keep_temp,
+        "timeout": args.render_timeout,
+        "cache_dir": args.cache_dir,
+        "no_cache": args.no_cache,
+        # Filings already render concurrently; match each one's statements serially
+        "parse_workers": 1,
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class RenderArgs:
+    """Per-filing arguments handed to ``render_viewer_to_xlsx.process_filing``."""
+
+    filing: str
+    out: Path
+    one_period: bool
+    periods: Optional[str]
+    currency: str
+    scale_none: bool
+    scale_millions: bool
+    include_disclosures: bool
+    dump_role_map: Optional[Path]
+    label_style: str
+    expand_dimensions: bool
+    no_scale_hint: bool
+    save_viewer_json: Optional[Path]
+    verbose: bool
+    temp_dir: Optional[Path]
+    keep_temp: bool
+    timeout: int
+    cache_dir: Optional[Path]
+    no_cache: bool
+    parse_workers: int
+    meta_links_candidates: Optional[List[Path]] = None
+
+
+def make_render_args(
     filing_input: Path,
     output_path: Path,
-    args: argparse.Namespace,
+    render_template: Dict[str, Any],
     meta_links_candidates: Optional[List[Path]] = None,
-) -> SimpleNamespace:
-    return SimpleNamespace(
-        filing=str(filing_input),
-        out=output_path,
-        one_period=args.one_period,
-        periods=args.periods,
-        currency=args.currency,
-        scale_none=args.scale_none,
-        scale_millions=not args.scale_none,
-        include_disclosures=args.include_disclosures,
-        dump_role_map=args.dump_role_map,
-        label_style=args.label_style,
-        expand_dimensions=not args.collapse_dimensions,
-        no_scale_hint=args.no_scale_hint,
-        save_viewer_json=args.save_viewer_json,
-        verbose=args.verbose,
-        temp_dir=args.render_temp_dir,
-        keep_temp=args.keep_temp,
-        timeout=args.render_timeout,
-        meta_links_candidates=(
-            [str(path) for path in meta_links_candidates]
-            if meta_links_candidates
-            else None
-        ),
-    )
+    temp_dir: Optional[Path] = None,
+) -> RenderArgs:
+    fields = dict(render_template)
+    fields["filing"] = str(filing_input)
+    fields["out"] = output_path
+    fields["meta_links_candidates"] = meta_links_candidates or None
+    if temp_dir:
+        fields["temp_dir"] = temp_dir
+    return RenderArgs(**fields)
 
 
 def determine_filing_input(download_result: DownloadResult) -> Optional[Path]:
@@ -269,8 +331,8 @@ def determine_filing_input(download_result: DownloadResult) -> Optional[Path]:
 
     base_dir = download_result.local_path
 
-    def is_split_report(path: Path) -> bool:
-        name = path.name.lower()
+    def is_split_report(name: str) -> bool:
+        name = name.lower()
         if not name.endswith((".htm", ".html")):
             return False
         if name.startswith("r") and name[1:-4].isdigit():
@@ -279,62 +341,61 @@ def determine_filing_input(download_result: DownloadResult) -> Optional[Path]:
             return True
         return False
 
-    def find_first(patterns: Sequence[str]) -> Optional[Path]:
-        for pattern in patterns:
-            matches = sorted(base_dir.glob(pattern))
-            if matches:
-                return matches[0]
-        return None
+    # One directory listing serves every lookup below. Each rule only needs its
+    # alphabetically smallest match, so take min() per rule instead of sorting.
+    try:
+        with os.scandir(base_dir) as entries:
+            file_names = [entry.name for entry in entries if entry.is_file()]
+    except OSError:
+        file_names = []
+
+    if "ixviewer.zip" in file_names:
+        return base_dir / "ixviewer.zip"
+
+    zip_names = [name for name in file_names if name.lower().endswith(".zip")]
+    zip_priority = ("ixbrl.zip", "-xbrl.zip", "_xbrl.zip", "xbrl.zip")
+    for suffix in zip_priority:
+        prioritized_zip = min(
+            (name for name in zip_names if name.lower().endswith(suffix)), default=None
+        )
+        if prioritized_zip:
+            return base_dir / prioritized_zip
 
-    ixviewer_zip = base_dir / "ixviewer.zip"
-    if ixviewer_zip.exists():
-        return ixviewer_zip
+    htm_names = [name for name in file_names if name.lower().endswith(".htm")]
+    html_names = [name for name in file_names if name.lower().endswith(".html")]
 
-    zip_priority = (
-        "*ixbrl.zip",
-        "*-ixbrl.zip",
-        "*-xbrl.zip",
-        "*_ixbrl.zip",
-        "*_xbrl.zip",
-        "*xbrl.zip",
-    )
-    prioritized_zip = find_first(zip_priority)
-    if prioritized_zip:
-        return prioritized_zip
+    # Resolve the primary document from the listing. DownloadResult's
+    # primary_file_path would stat and glob the directory again on every access.
+    # scandir order is filesystem-defined, so fall back to the smallest name.
+    primary_name = download_result.filing.primary_document
+    if primary_name not in file_names:
+        primary_name = min(htm_names, default=None) or min(html_names, default=None)
+    primary = base_dir / primary_name if primary_name else None
 
-    primary = download_result.primary_file_path
-    if primary and primary.exists() and not is_split_report(primary):
+    if primary and not is_split_report(primary.name):
         return primary
 
-    html_candidates = sorted(base_dir.glob("*.htm")) + sorted(base_dir.glob("*.html"))
-    for html_path in html_candidates:
-        if not is_split_report(html_path):
-            return html_path
+    for names in (htm_names, html_names):
+        inline_name = min(
+            (name for name in names if not is_split_report(name)), default=None
+        )
+        if inline_name:
+            return base_dir / inline_name
 
-    if primary and primary.exists():
+    if primary:
         return primary
 
-    zip_fallback = find_first(("*.zip",))
-    if zip_fallback:
-        return zip_fallback
-
-    return html_candidates[0] if html_candidates else None
+    fallback = min(zip_names, default=None)
+    if not fallback:
+        fallback = min(htm_names or html_names, default=None)
+    return base_dir / fallback if fallback else None
 
 
 def build_excel_path(base_dir: Path, filing: Filing) -> Path:
     ticker = filing.ticker or f"CIK_{filing.cik}"
-    accession_number = getattr(filing, "accession_number", "") or ""
-    accession = filing.accession_clean or accession_number.replace("-", "")
-    date_str = (
-        filing.report_date.strftime("%Y-%m-%d")
-        if filing.report_date
-        else filing.filing_date.strftime("%Y-%m-%d")
-    )
-    file_name = (
-        f"{filing.form_type}_{date_str}_{accession}.xlsx"
-        if accession
-        else f"{filing.form_type}_{date_str}.xlsx"
-    )
+    accession = filing.accession_clean
+    stem = f"{filing.form_type}_{filing.period_date}"
+    file_name = f"{stem}_{accession}.xlsx" if accession else f"{stem}.xlsx"
     return base_dir / ticker / file_name
 
 
@@ -346,33 +407,48 @@ def collect_filings_for_identifier(
     start_date: Optional[datetime],
     end_date: Optional[datetime],
 ) -> List[Filing]:
-    filings: List[Filing] = []
-    for form_type, count in form_requests:
-        filters = SearchFilters(
-            form_types=[form_type],
-            start_date=None,
-            end_date=None,
-            include_amendments=include_amendments,
-            max_results=count,
-        )
+    from sec_downloader.models import SearchFilters
 
-        filters.start_date = start_date
-        filters.end_date = end_date
+    limits = dict(form_requests)
+    if not limits:
+        return []
 
-        logger.info(
-            "Searching %s filings for %s (limit %s)", form_type, identifier, count
-        )
-        try:
-            matches = search.search(identifier, filters)
-        except Exception as exc:
-            logger.error("Failed to search %s for %s: %s", form_type, identifier, exc)
-            continue
+    # One submissions lookup covers every requested form; the per-form limits
+    # are applied locally so a busy 10-Q history cannot crowd out the 10-Ks.
+    filters = SearchFilters(
+        form_types=list(limits),
+        start_date=start_date,
+        end_date=end_date,
+        include_amendments=include_amendments,
+        max_results=None,
+    )
+
+    logger.info(
+        "Searching %s filings for %s (limits %s)",
+        "/".join(limits),
+        identifier,
+        ", ".join(f"{form_type}: {count}" for form_type, count in limits.items()),
+    )
+    try:
+        matches = search.search(identifier, filters)
+    except Exception as exc:
+        logger.error("Failed to search filings for %s: %s", identifier, exc)
+        return []
+
+    buckets: Dict[str, List[Filing]] = {form_type: [] for form_type in limits}
+    for match in matches:
+        # Amendments (10-K/A) count toward their base form's limit
+        base_form = match.form_type.split("/", 1)[0]
+        bucket = buckets.get(base_form)
+        if bucket is not None and len(bucket) < limits[base_form]:
+            bucket.append(match)
 
-        if not matches:
+    filings: List[Filing] = []
+    for form_type, bucket in buckets.items():
+        if not bucket:
             logger.warning("No %s filings found for %s", form_type, identifier)
             continue
-
-        filings.extend(matches[:count])
+        filings.extend(bucket)
 
     # Sort newest first for downstream reporting
     filings.sort(key=lambda f: f.filing_date, reverse=True)
@@ -385,6 +461,7 @@ def download_filings_for_identifier(
     downloader: FilingDownload,
     config: DownloadConfig,
     quiet: bool,
+    on_result: Optional[Callable[[DownloadResult], None]] = None,
 ) -> List[DownloadResult]:
     if not filings:
         logger.warning("Skipping download for %s (no filings requested)", identifier)
@@ -393,79 +470,155 @@ def download_filings_for_identifier(
     if not quiet:
         print(f"\n📥 Downloading {len(filings)} filing(s) for {identifier}...")
 
-    return downloader.download_filings(filings, config, show_progress=not quiet)
+    return downloader.download_filings(
+        filings, config, show_progress=not quiet, on_result=on_result
+    )
 
 
-def render_downloaded_filings(
-    results: List[DownloadResult], args: argparse.Namespace
-) -> Dict[str, Path]:
-    generated_files: Dict[str, Path] = {}
+META_LINKS_NAMES = ("MetaLinks.json", "metalink.json", "metalinks.json")
 
-    for result in results:
-        filing = result.filing
 
-        if not result.success:
-            logger.error(
-                "Download failed for %s: %s", filing.display_name, result.error
-            )
+def find_meta_links(base_dir: Path) -> List[Path]:
+    """Return MetaLinks files in a download dir and its ixviewer bundle, best first."""
+    found: List[Path] = []
+    for directory in (base_dir, base_dir / "ixviewer"):
+        # One listing per directory instead of a stat() per candidate name
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
             continue
+        found.extend(directory / name for name in META_LINKS_NAMES if name in names)
+    return found
 
-        input_path = determine_filing_input(result)
-        if not input_path:
-            logger.error("Could not locate filing input for %s", filing.display_name)
-            continue
 
-        excel_path = build_excel_path(args.excel_dir, filing)
-        excel_path.parent.mkdir(parents=True, exist_ok=True)
+def prefetch_files(paths: Iterable[Path]) -> None:
+    """Ask the kernel to start reading render inputs into the page cache.
 
-        if excel_path.exists() and not args.overwrite:
-            logger.info(
-                "Excel already exists for %s; skipping (use --overwrite to regenerate)",
-                filing.display_name,
-            )
-            generated_files[filing.display_name] = excel_path
+    Arelle reads these files from its own subprocess; issuing readahead first lets
+    the disk work overlap with interpreter and plugin start-up.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
             continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
-        meta_candidates: List[Path] = []
-        if result.local_path:
-            base_dir = result.local_path
-            meta_candidates.extend(
-                [
-                    base_dir / "MetaLinks.json",
-                    base_dir / "metalink.json",
-                    base_dir / "metalinks.json",
-                ]
-            )
-            meta_candidates.extend(
-                [
-                    base_dir / "ixviewer" / "MetaLinks.json",
-                    base_dir / "ixviewer" / "metalink.json",
-                    base_dir / "ixviewer" / "metalinks.json",
-                ]
-            )
 
-        meta_filtered = [path for path in meta_candidates if path.exists()]
+def build_render_temp_dir(args: argparse.Namespace, excel_path: Path) -> Path:
+    """Return a per-filing Arelle scratch directory so concurrent renders never collide."""
+    base_dir = args.render_temp_dir or Path(tempfile.gettempdir()) / "sec_processor"
+    return base_dir / f"{excel_path.parent.name}_{excel_path.stem}"
+
+
+def render_filing(
+    result: DownloadResult,
+    args: argparse.Namespace,
+    render_template: Dict[str, Any],
+) -> Optional[Path]:
+    """Render a single downloaded filing, returning the workbook path on success."""
+    import render_viewer_to_xlsx as renderer
+
+    filing = result.filing
 
-        render_args = make_render_namespace(
-            input_path, excel_path, args, meta_links_candidates=meta_filtered
+    if not result.success:
+        logger.error("Download failed for %s: %s", filing.display_name, result.error)
+        return None
+
+    # Check for an existing workbook first so incremental runs skip the directory
+    # scans below for every filing that was already rendered.
+    excel_path = build_excel_path(args.excel_dir, filing)
+    if excel_path.exists() and not args.overwrite:
+        logger.info(
+            "Excel already exists for %s; skipping (use --overwrite to regenerate)",
+            filing.display_name,
         )
+        return excel_path
 
-        try:
-            renderer.validate_arguments(render_args)
-            renderer.process_filing(render_args)
-        except SystemExit as exc:
-            logger.error(
-                "Rendering aborted for %s (exit code %s)", filing.display_name, exc.code
-            )
-            continue
-        except Exception as exc:
-            logger.error("Rendering failed for %s: %s", filing.display_name, exc)
-            continue
+    input_path = determine_filing_input(result)
+    if not input_path:
+        logger.error("Could not locate filing input for %s", filing.display_name)
+        return None
+
+    meta_filtered = find_meta_links(result.local_path) if result.local_path else []
+
+    render_args = make_render_args(
+        input_path,
+        excel_path,
+        render_template,
+        meta_links_candidates=meta_filtered,
+        temp_dir=build_render_temp_dir(args, excel_path),
+    )
 
-        generated_files[filing.display_name] = excel_path
-        logger.info("Generated %s", excel_path)
+    prefetch_files([input_path, *meta_filtered])
 
-    return generated_files
+    try:
+        renderer.process_filing(render_args)
+    except SystemExit as exc:
+        logger.error(
+            "Rendering aborted for %s (exit code %s)", filing.display_name, exc.code
+        )
+        return None
+    except Exception as exc:
+        logger.error("Rendering failed for %s: %s", filing.display_name, exc)
+        return None
+
+    logger.info("Generated %s", excel_path)
+    return excel_path
+
+
+class RenderQueue:
+    """Renders downloaded filings on a worker pool as their downloads finish.
+
+    Downloads are network-bound and rendering is dominated by the Arelle
+    subprocess, so each finished download is handed straight to a render worker
+    while the remaining downloads continue. Each render gets its own temp
+    directory, which lets several Arelle processes run side by side.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        # The renderer pulls in the processor package and openpyxl; import it
+        # only once arguments are validated so --help and usage errors stay fast.
+        import render_viewer_to_xlsx as renderer
+
+        self.args = args
+        self.render_template = build_render_template(args)
+        # Filing and output paths come from our own directory scans, so only the
+        # shared render options need validating, and only once per run.
+        renderer.validate_render_options(SimpleNamespace(**self.render_template))
+        self._executor = ThreadPoolExecutor(max_workers=args.render_workers)
+        self._futures: List[Tuple[DownloadResult, Future]] = []
+
+    def __enter__(self) -> "RenderQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._executor.shutdown(wait=True)
+
+    def submit(self, result: DownloadResult) -> None:
+        """Queue a download result for rendering."""
+        future = self._executor.submit(
+            render_filing, result, self.args, self.render_template
+        )
+        self._futures.append((result, future))
+
+    def collect(self) -> Dict[str, Path]:
+        """Wait for every queued render and map display names to workbooks."""
+        generated_files: Dict[str, Path] = {}
+        for result, future in self._futures:
+            excel_path = future.result()
+            if excel_path:
+                generated_files[result.filing.display_name] = excel_path
+        return generated_files
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -473,6 +626,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     setup_logging(args.verbose)
 
+    from sec_downloader import EdgarClient, FilingDownload, FilingSearch
+    from sec_downloader.models import DownloadConfig
+    from sec_downloader.utils import validate_date_range
+
     if args.max_parallel < 1 or args.max_parallel > 10:
         raise ValueError("--max-parallel must be between 1 and 10")
     if args.download_timeout < 5:
@@ -481,6 +638,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         raise ValueError("--retries must be non-negative")
     if args.render_timeout < 60:
         raise ValueError("--render-timeout must be at least 60 seconds")
+    if args.render_workers < 1:
+        raise ValueError("--render-workers must be at least 1")
 
     start_date = parse_date_string(args.start_date)
     end_date = parse_date_string(args.end_date)
@@ -502,7 +661,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if not args.quiet:
         print(f"📊 Processing {len(identifiers)} identifier(s)")
 
-    edgar_client = EdgarClient()
+    # One client (and one keep-alive session) serves every identifier in the run
+    edgar_client = EdgarClient(max_connections=args.max_parallel)
     search = FilingSearch(edgar_client)
     downloader = FilingDownload(edgar_client)
 
@@ -520,32 +680,41 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         verify_downloads=not args.skip_verify,
     )
 
-    overall_generated: Dict[str, Path] = {}
-
-    for identifier in identifiers:
-        filings = collect_filings_for_identifier(
-            identifier,
-            search,
-            form_requests,
-            args.include_amendments,
-            start_date,
-            end_date,
-        )
+    with RenderQueue(args) as render_queue:
+        for identifier in identifiers:
+            filings = collect_filings_for_identifier(
+                identifier,
+                search,
+                form_requests,
+                args.include_amendments,
+                start_date,
+                end_date,
+            )
 
-        if not filings:
-            logger.warning("No filings matched criteria for %s", identifier)
-            continue
+            if not filings:
+                logger.warning("No filings matched criteria for %s", identifier)
+                continue
+
+            download_filings_for_identifier(
+                identifier,
+                filings,
+                downloader,
+                download_config,
+                args.quiet,
+                on_result=render_queue.submit,
+            )
 
-        results = download_filings_for_identifier(
-            identifier, filings, downloader, download_config, args.quiet
-        )
-        generated = render_downloaded_filings(results, args)
-        overall_generated.update(generated)
+        overall_generated = render_queue.collect()
 
     if not args.quiet and overall_generated:
-        print("\n✅ Generated Excel files:")
-        for display_name, path in overall_generated.items():
-            print(f"   • {display_name} → {path}")
+        summary_lines = ["\n✅ Generated Excel files:"]
+        summary_lines.extend(
+            f"   • {display_name} → {path}"
+            for display_name, path in overall_generated.items()
+        )
+        # One write keeps the summary contiguous and avoids a syscall per line
+        sys.stdout.write("\n".join(summary_lines) + "\n")
+        sys.stdout.flush()
 
     if not overall_generated:
         logger.warning("No Excel files were generated")
@@ -29,9 +29,8 @@ from typing import List, Optional
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from sec_downloader import FilingSearch, FilingDownload, EdgarClient
-from sec_downloader.models import SearchFilters, DownloadConfig
-from sec_downloader.utils import validate_date_range
+# sec_downloader (requests, tqdm) is imported inside the functions that use it so
+# --help and argument errors do not pay for loading the HTTP stack.
 
 
 def setup_logging(verbose: bool) -> None:
@@ -181,6 +180,8 @@ Note: Use --include-amendments to also download 10-K/A and 10-Q/A filings.
 
 def validate_arguments(args) -> None:
     """Validate command-line arguments."""
+    from sec_downloader.utils import validate_date_range
+
     # Validate date range
     validate_date_range(args.start_date, args.end_date)
 
@@ -234,6 +235,9 @@ def main():
         # Parse form types
         form_types = parse_form_types(args.form)
 
+        from sec_downloader import FilingSearch, FilingDownload, EdgarClient
+        from sec_downloader.models import SearchFilters, DownloadConfig
+
         # Create search filters
         filters = SearchFilters(
             form_types=form_types,
@@ -254,7 +258,7 @@ def main():
         )
 
         # Initialize components
-        edgar_client = EdgarClient()
+        edgar_client = EdgarClient(max_connections=args.max_parallel)
         search = FilingSearch(edgar_client)
         downloader = FilingDownload(edgar_client)
 
@@ -23,22 +23,23 @@ import argparse
 import csv
 import json
 import logging
+import os
+import shutil
 import sys
 import tempfile
+from operator import itemgetter
 from pathlib import Path
 
-from src.processor import (
-    InputHandler,
-    ArelleProcessor,
-    ViewerDataExtractor,
-    DataParser,
-    ValueFormatter,
-    ExcelGenerator,
-)
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+META_LINKS_NAMES = ("MetaLinks.json", "metalink.json")
+
 
 def setup_logging(verbose: bool) -> None:
     """Configure logging based on verbosity setting."""
@@ -170,6 +171,25 @@ Examples:
         help="Timeout for Arelle processing in seconds (default: 300)",
     )
 
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Processes used to match facts to statements (default: 1)",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for cached viewer data (default: ~/.cache/sec_extractor/viewer)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run Arelle instead of reusing cached viewer data",
+    )
+
     return parser
 
 
@@ -192,19 +212,25 @@ def _dump_role_map(role_map, output_path: Path) -> None:
         "isDefault",
     ]
 
+    metadata_keys = fieldnames[1:]
+
     try:
+        # Sort on precomputed keys; roles without an order go last
+        ordered = sorted(
+            (
+                (metadata.get("order") or float("inf"), role_uri, metadata)
+                for role_uri, metadata in role_map.items()
+            ),
+            key=itemgetter(0),
+        )
+
         with output_path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for role_uri, metadata in sorted(
-                role_map.items(), key=lambda item: item[1].get("order") or float("inf")
-            ):
-                row = {"role_uri": role_uri}
-                row.update(
-                    {key: metadata.get(key) for key in fieldnames if key != "role_uri"}
-                )
-                writer.writerow(row)
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                [role_uri, *[metadata.get(key) for key in metadata_keys]]
+                for _, role_uri, metadata in ordered
+            )
 
         logger.info("Role metadata written to %s", output_path)
     except Exception as exc:
@@ -220,33 +246,63 @@ def _dump_viewer_json(viewer_data, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with output_path.open("w", encoding="utf-8") as handle:
-            json.dump(viewer_data, handle)
+        if orjson is not None:
+            with output_path.open("wb") as handle:
+                handle.write(orjson.dumps(viewer_data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with output_path.open("w", encoding="utf-8") as handle:
+                json.dump(viewer_data, handle)
         logger.info("Viewer JSON written to %s", output_path)
     except Exception as exc:
         logger.warning("Failed to write viewer JSON: %s", exc)
 
 
+def _sibling_meta_links(filing_path) -> list:
+    """Return MetaLinks files next to a filing document, best first."""
+    directory = Path(filing_path).parent
+    # One listing of the directory instead of a stat() per candidate name
+    try:
+        with os.scandir(directory) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return []
+    return [directory / name for name in META_LINKS_NAMES if name in names]
+
+
+def _existing_meta_links(candidates) -> list:
+    """Return the distinct candidate paths that exist, preserving their order."""
+    return [path for path in dict.fromkeys(map(Path, candidates)) if path.is_file()]
+
+
 def validate_arguments(args) -> None:
     """Validate command-line arguments."""
     from urllib.parse import urlparse
 
+    from src.processor.input_handler import InputHandler
+
     # Validate filing source
-    if args.filing.startswith("http"):
+    if InputHandler.is_url(args.filing):
         # URL validation
         parsed = urlparse(args.filing)
         if not parsed.netloc:
             raise ValueError(f"Invalid URL: {args.filing}")
     else:
-        # File path validation
-        if not Path(args.filing).exists():
+        # File path validation (is_file() is one stat and rejects directories)
+        if not Path(args.filing).is_file():
             raise FileNotFoundError(f"Filing not found: {args.filing}")
 
-    # Validate output directory
-    output_dir = args.out.parent
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True, exist_ok=True)
+    # Ensure the output directory exists; exist_ok makes a prior check redundant
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+
+    validate_render_options(args)
+
 
+def validate_render_options(args) -> None:
+    """Validate options that do not depend on the filing or output path.
+
+    Batch callers rendering many filings with the same options run this once
+    instead of calling validate_arguments for every filing.
+    """
     # Validate periods format
     if args.periods:
         periods = [p.strip() for p in args.periods.split(",")]
@@ -262,73 +318,102 @@ def validate_arguments(args) -> None:
     if args.timeout < 60:
         raise ValueError("Timeout must be at least 60 seconds")
 
+    if args.parse_workers < 1:
+        raise ValueError("Parse workers must be at least 1")
+
 
 def process_filing(args) -> None:
     """Process the filing through the complete pipeline."""
+    # The processor package pulls in openpyxl and requests; importing it here
+    # keeps --help and argument validation errors instant.
+    from src.processor import (
+        InputHandler,
+        ArelleProcessor,
+        ViewerDataExtractor,
+        DataParser,
+        ValueFormatter,
+        ExcelGenerator,
+        ViewerCache,
+    )
 
     # Create temporary directory
     temp_dir = args.temp_dir or Path(tempfile.gettempdir()) / "sec_processor"
-    temp_dir.mkdir(exist_ok=True)
+    temp_dir.mkdir(parents=True, exist_ok=True)
 
     filing_source = None
 
     try:
-        logger.info(f"Starting processing of: {args.filing}")
-
-        # Step 1: Input validation and handling
-        logger.info("Step 1: Validating and preparing input...")
-        input_handler = InputHandler(temp_dir)
-        filing_source = input_handler.create_source(args.filing)
-
-        if not filing_source.validate():
-            raise ValueError("Filing source validation failed")
-
-        filing_path = filing_source.get_path()
-        meta_links_candidates = []
-
-        # Include explicit candidates provided by the caller (e.g., original download directory)
-        extra_meta_links = getattr(args, "meta_links_candidates", None)
-        if extra_meta_links:
-            for candidate in extra_meta_links:
-                candidate_path = Path(candidate)
-                if candidate_path.exists():
-                    meta_links_candidates.append(candidate_path)
-
-        original_meta_links = Path(filing_path).with_name("MetaLinks.json")
-        if original_meta_links.exists():
-            meta_links_candidates.append(original_meta_links)
-
-        legacy_meta_links = Path(filing_path).with_name("metalink.json")
-        if legacy_meta_links.exists():
-            meta_links_candidates.append(legacy_meta_links)
-
-        if not input_handler.validate_filing(filing_path):
-            logger.warning("File does not appear to be a valid iXBRL filing")
-
-        logger.info(f"Input prepared: {filing_path}")
-
-        # Step 2: Arelle processing
-        logger.info("Step 2: Processing with Arelle...")
-        arelle_processor = ArelleProcessor(temp_dir, args.timeout)
-
-        # Check if Arelle is available
-        if not arelle_processor.check_arelle_available():
-            logger.warning("Arelle not found, attempting installation...")
-            if not arelle_processor.install_arelle():
-                raise RuntimeError(
-                    "Failed to install Arelle. Please install manually: pip install arelle"
-                )
-
-        viewer_html_path = arelle_processor.generate_viewer_html(filing_path)
-        logger.info(f"Arelle processing complete: {viewer_html_path}")
-
-        # Step 3: JSON extraction
-        logger.info("Step 3: Extracting viewer data...")
-        json_extractor = ViewerDataExtractor()
-        viewer_data = json_extractor.extract_viewer_data(
-            viewer_html_path, meta_links_candidates=meta_links_candidates
+        logger.info("Starting processing of: %s", args.filing)
+
+        # Resolve MetaLinks once: caller-provided candidates (e.g. the original
+        # download directory) first, then files next to a local filing. The same
+        # list feeds the cache key and the extractor, so each path is probed once.
+        is_local_filing = not InputHandler.is_url(args.filing)
+        meta_links_candidates = list(
+            dict.fromkeys(
+                [
+                    *_existing_meta_links(
+                        getattr(args, "meta_links_candidates", None) or []
+                    ),
+                    *(_sibling_meta_links(args.filing) if is_local_filing else []),
+                ]
+            )
         )
 
+        viewer_cache = None
+        cache_key = None
+        if not args.no_cache and is_local_filing:
+            viewer_cache = ViewerCache(args.cache_dir)
+            cache_key = viewer_cache.make_key(args.filing, meta_links_candidates)
+
+        viewer_data = viewer_cache.load(cache_key) if viewer_cache else None
+
+        if viewer_data is not None:
+            logger.info("Steps 1-3: Reusing cached viewer data (%s)", cache_key)
+        else:
+            # Step 1: Input validation and handling
+            logger.info("Step 1: Validating and preparing input...")
+            input_handler = InputHandler(temp_dir)
+            filing_source = input_handler.create_source(args.filing)
+
+            if not filing_source.validate():
+                raise ValueError("Filing source validation failed")
+
+            filing_path = Path(filing_source.get_path())
+            if filing_path != Path(args.filing):
+                # ZIP and URL sources resolve to a different directory than --filing
+                meta_links_candidates += _sibling_meta_links(filing_path)
+
+            if not input_handler.validate_filing(filing_path):
+                logger.warning("File does not appear to be a valid iXBRL filing")
+
+            logger.info("Input prepared: %s", filing_path)
+
+            # Step 2: Arelle processing
+            logger.info("Step 2: Processing with Arelle...")
+            arelle_processor = ArelleProcessor(temp_dir, args.timeout)
+
+            # Check if Arelle is available
+            if not arelle_processor.check_arelle_available():
+                logger.warning("Arelle not found, attempting installation...")
+                if not arelle_processor.install_arelle():
+                    raise RuntimeError(
+                        "Failed to install Arelle. Please install manually: pip install arelle"
+                    )
+
+            viewer_html_path = arelle_processor.generate_viewer_html(filing_path)
+            logger.info("Arelle processing complete: %s", viewer_html_path)
+
+            # Step 3: JSON extraction
+            logger.info("Step 3: Extracting viewer data...")
+            json_extractor = ViewerDataExtractor()
+            viewer_data = json_extractor.extract_viewer_data(
+                viewer_html_path, meta_links_candidates=meta_links_candidates
+            )
+
+            if viewer_cache:
+                viewer_cache.store(cache_key, viewer_data)
+
         if args.dump_role_map:
             _dump_role_map(viewer_data.get("role_map"), args.dump_role_map)
 
@@ -348,13 +433,14 @@ def process_filing(args) -> None:
             label_style=args.label_style,
             use_scale_hint=not args.no_scale_hint,
             expand_dimensions=args.expand_dimensions,
+            parse_workers=args.parse_workers,
         )
         result = data_parser.parse_viewer_data(viewer_data)
 
         if not result.success:
             raise ValueError(f"Data parsing failed: {result.error}")
 
-        logger.info(f"Parsed {len(result.statements)} financial statements")
+        logger.info("Parsed %d financial statements", len(result.statements))
 
         # Step 5: Excel generation
         logger.info("Step 5: Generating Excel file...")
@@ -363,34 +449,37 @@ def process_filing(args) -> None:
             result, str(args.out), single_period=args.one_period
         )
 
-        logger.info(f"✅ Excel file generated: {args.out}")
+        logger.info("✅ Excel file generated: %s", args.out)
 
-        # Print summary
-        print(f"✅ Excel file generated: {args.out}")
+        # Print summary. download_and_render runs several filings at once, so
+        # each filing's lines go out in a single write and never interleave.
+        summary_lines = [f"✅ Excel file generated: {args.out}"]
         if args.verbose:
-            print(f"\nProcessing Summary:")
-            print(f"  Company: {result.company_name}")
-            print(f"  Form Type: {result.form_type}")
-            print(f"  Filing Date: {result.filing_date}")
-            print(f"  Statements: {len(result.statements)}")
-
-            for statement in result.statements:
-                print(
-                    f"    - {statement.name}: {len(statement.periods)} periods, {len(statement.rows)} rows"
-                )
+            summary_lines += [
+                "\nProcessing Summary:",
+                f"  Company: {result.company_name}",
+                f"  Form Type: {result.form_type}",
+                f"  Filing Date: {result.filing_date}",
+                f"  Statements: {len(result.statements)}",
+            ]
+            summary_lines.extend(
+                f"    - {statement.name}: {len(statement.periods)} periods, "
+                f"{len(statement.rows)} rows"
+                for statement in result.statements
+            )
 
             if result.warnings:
-                print(f"\nWarnings:")
-                for warning in result.warnings:
-                    print(f"  - {warning}")
+                summary_lines.append("\nWarnings:")
+                summary_lines.extend(f"  - {warning}" for warning in result.warnings)
 
-    except Exception as e:
-        logger.error(f"Processing failed: {e}")
-        print(f"❌ Processing failed: {e}")
-        if args.verbose:
-            import traceback
+        sys.stdout.write("\n".join(summary_lines) + "\n")
+        sys.stdout.flush()
 
-            traceback.print_exc()
+    except Exception as e:
+        # Attach the traceback to the log record only in verbose mode
+        logger.error("Processing failed: %s", e, exc_info=args.verbose)
+        sys.stdout.write(f"❌ Processing failed: {e}\n")
+        sys.stdout.flush()
         sys.exit(1)
 
     finally:
@@ -399,15 +488,11 @@ def process_filing(args) -> None:
             try:
                 filing_source.cleanup()
             except Exception as e:
-                logger.warning(f"Cleanup warning: {e}")
+                logger.warning("Cleanup warning: %s", e)
 
-        if not args.keep_temp and temp_dir.exists():
-            try:
-                import shutil
-
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logger.warning(f"Temp directory cleanup warning: {e}")
+        if not args.keep_temp:
+            # Best effort: a missing or partially removable directory is not an error
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 def main():
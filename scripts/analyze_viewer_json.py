@@ -17,26 +17,90 @@ import json
 import sys
 from collections import defaultdict, Counter
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Iterator, Tuple
 
+try:
+    import ijson
+except ImportError:  # optional; without it the whole file is loaded up front
+    ijson = None
 
-class ViewerJSONAnalyzer:
-    """Analyzes iXBRL viewer JSON structure."""
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder writes the same report
+    orjson = None
 
-    def __init__(self, json_path: str):
-        """Load and parse viewer JSON file."""
-        self.json_path = Path(json_path)
 
-        with open(self.json_path, "r") as f:
-            self.data = json.load(f)
+# ijson prefix of the report analysed (sourceReports[0].targetReports[0])
+TARGET_PREFIX = "sourceReports.item.targetReports.item"
+
+
+class ViewerJSONAnalyzer:
+    """Analyzes iXBRL viewer JSON structure.
 
-        # Extract target data (main content)
-        self.target = self.data["sourceReports"][0]["targetReports"][0]
+    Viewer JSON for a large 10-K runs to hundreds of MB, almost all of it facts
+    and concepts. When ijson is installed those sections are streamed one entry
+    at a time; only the role definitions and presentation relationships, which
+    need random access, are held in memory.
+    """
 
-        self.role_defs = self.target.get("roleDefs", {})
-        self.rels_pres = self.target.get("rels", {}).get("pres", {})
-        self.facts = self.target.get("facts", {})
-        self.concepts = self.target.get("concepts", {})
+    def __init__(self, json_path: str):
+        """Load the role and presentation sections of a viewer JSON file."""
+        self.json_path = Path(json_path)
+        self._target = None
+        self._child_maps: Dict[str, Dict[str, List[str]]] = {}
+
+        self.role_defs = self._load_target_section("roleDefs")
+        self.rels_pres = self._load_target_section("rels.pres")
+
+    def _load_target(self) -> Dict[str, Any]:
+        """Parse the whole file once (fallback when ijson is unavailable)."""
+        if self._target is None:
+            with open(self.json_path, "r") as f:
+                data = json.load(f)
+
+            # Extract target data (main content)
+            self._target = data["sourceReports"][0]["targetReports"][0]
+        return self._target
+
+    def _target_events(self, handle) -> Iterator[Tuple[str, str, Any]]:
+        """Yield parse events, stopping once the first target report closes."""
+        for prefix, event, value in ijson.parse(handle, use_float=True):
+            yield prefix, event, value
+            if prefix == TARGET_PREFIX and event == "end_map":
+                return
+
+    def _load_target_section(self, path: str) -> Dict[str, Any]:
+        """Load one (small) dotted section of the first target report."""
+        if ijson is None:
+            section = self._load_target()
+            for key in path.split("."):
+                section = section.get(key, {})
+            return section
+
+        with open(self.json_path, "rb") as f:
+            events = self._target_events(f)
+            return next(ijson.items(events, f"{TARGET_PREFIX}.{path}"), {})
+
+    def _iter_target_items(self, section: str) -> Iterator[Tuple[str, Any]]:
+        """Iterate (key, value) pairs of a large section without loading it whole."""
+        if ijson is None:
+            yield from self._load_target().get(section, {}).items()
+            return
+
+        with open(self.json_path, "rb") as f:
+            events = self._target_events(f)
+            yield from ijson.kvitems(events, f"{TARGET_PREFIX}.{section}")
+
+    def _child_map(self, role_id: str) -> Dict[str, List[str]]:
+        """Return parent -> child concept names for a role, built once per role."""
+        child_map = self._child_maps.get(role_id)
+        if child_map is None:
+            child_map = {
+                parent: [child["t"] for child in children]
+                for parent, children in self.rels_pres.get(role_id, {}).items()
+            }
+            self._child_maps[role_id] = child_map
+        return child_map
 
     def analyze_statements(self) -> Dict[str, Any]:
         """Analyze financial statement structure."""
@@ -47,14 +111,14 @@ class ViewerJSONAnalyzer:
 
             if "Statement -" in role_name:
                 statement_type = self._classify_statement(role_name)
-                presentation_data = self.rels_pres.get(role_id, {})
+                child_map = self._child_map(role_id)
 
                 statements[role_id] = {
                     "name": role_name,
                     "type": statement_type,
-                    "root_concepts": list(presentation_data.keys()),
-                    "total_concepts": self._count_concepts_in_tree(presentation_data),
-                    "has_presentation": bool(presentation_data),
+                    "root_concepts": list(child_map.keys()),
+                    "total_concepts": self._count_concepts_in_tree(child_map),
+                    "has_presentation": bool(child_map),
                 }
 
         return statements
@@ -64,31 +128,25 @@ class ViewerJSONAnalyzer:
         if role_id not in self.rels_pres:
             return {"error": f"No presentation data for role {role_id}"}
 
-        pres_data = self.rels_pres[role_id]
+        child_map = self._child_map(role_id)
 
         # Find root nodes (not referenced as children)
-        all_children = set()
-        for parent, children in pres_data.items():
-            for child in children:
-                all_children.add(child["t"])
-
-        root_concepts = [c for c in pres_data.keys() if c not in all_children]
+        all_children = set().union(*child_map.values())
+        root_concepts = [c for c in child_map if c not in all_children]
 
         # Build tree structure
         tree_info = {
             "root_concepts": root_concepts,
-            "total_parent_concepts": len(pres_data),
-            "total_child_relationships": sum(
-                len(children) for children in pres_data.values()
-            ),
-            "max_depth": self._calculate_max_depth(pres_data, root_concepts),
+            "total_parent_concepts": len(child_map),
+            "total_child_relationships": sum(map(len, child_map.values())),
+            "max_depth": self._calculate_max_depth(child_map, root_concepts),
             "tree_structure": {},
         }
 
         # Generate detailed tree for first root (sample)
         if root_concepts:
             tree_info["sample_tree"] = self._build_tree_structure(
-                root_concepts[0], pres_data, max_depth=3
+                root_concepts[0], child_map, max_depth=3
             )
 
         return tree_info
@@ -96,7 +154,7 @@ class ViewerJSONAnalyzer:
     def analyze_facts(self) -> Dict[str, Any]:
         """Analyze fact distribution and structure."""
         fact_stats = {
-            "total_facts": len(self.facts),
+            "total_facts": 0,
             "concepts_with_facts": set(),
             "periods_found": set(),
             "entities_found": set(),
@@ -104,43 +162,49 @@ class ViewerJSONAnalyzer:
             "fact_types": Counter(),
         }
 
-        for fact_id, fact_data in self.facts.items():
+        # Count each distinct (concept, period, entity, unit) context once while
+        # streaming, then classify per distinct context rather than per fact:
+        # filings repeat the same few thousand contexts across many facts.
+        context_counts: Counter = Counter()
+
+        for fact_id, fact_data in self._iter_target_items("facts"):
+            fact_stats["total_facts"] += 1
+
             # Handle different context formats (a, b, c, etc.)
-            contexts = [
-                k
-                for k in fact_data.keys()
-                if k != "v" and isinstance(fact_data[k], dict)
-            ]
-
-            for context_key in contexts:
-                context = fact_data[context_key]
-                if isinstance(context, dict):
-                    concept = context.get("c")
-                    period = context.get("p")
-                    entity = context.get("e")
-                    unit = context.get("m")
-
-                    if concept:
-                        fact_stats["concepts_with_facts"].add(concept)
-                    if period:
-                        fact_stats["periods_found"].add(period)
-                    if entity:
-                        fact_stats["entities_found"].add(entity)
-                    if unit:
-                        fact_stats["units_found"][str(unit)] += 1
-
-                    # Classify fact type
-                    if concept:
-                        if "Abstract" in concept:
-                            fact_stats["fact_types"]["abstract"] += 1
-                        elif unit == "usd":
-                            fact_stats["fact_types"]["monetary"] += 1
-                        elif unit == "shares":
-                            fact_stats["fact_types"]["shares"] += 1
-                        elif unit is False or unit == "pure":
-                            fact_stats["fact_types"]["dimensionless"] += 1
-                        else:
-                            fact_stats["fact_types"]["other"] += 1
+            context_counts.update(
+                (
+                    context.get("c"),
+                    context.get("p"),
+                    context.get("e"),
+                    context.get("m"),
+                )
+                for key, context in fact_data.items()
+                if key != "v" and isinstance(context, dict)
+            )
+
+        for (concept, period, entity, unit), count in context_counts.items():
+            if concept:
+                fact_stats["concepts_with_facts"].add(concept)
+            if period:
+                fact_stats["periods_found"].add(period)
+            if entity:
+                fact_stats["entities_found"].add(entity)
+            if unit:
+                fact_stats["units_found"][str(unit)] += count
+
+            # Classify fact type
+            if concept:
+                if "Abstract" in concept:
+                    fact_type = "abstract"
+                elif unit == "usd":
+                    fact_type = "monetary"
+                elif unit == "shares":
+                    fact_type = "shares"
+                elif unit is False or unit == "pure":
+                    fact_type = "dimensionless"
+                else:
+                    fact_type = "other"
+                fact_stats["fact_types"][fact_type] += count
 
         # Convert sets to lists for JSON serialization
         fact_stats["concepts_with_facts"] = len(fact_stats["concepts_with_facts"])
@@ -153,14 +217,20 @@ class ViewerJSONAnalyzer:
     def analyze_concepts(self) -> Dict[str, Any]:
         """Analyze concept definitions and labels."""
         concept_stats = {
-            "total_concepts": len(self.concepts),
+            "total_concepts": 0,
             "label_types": Counter(),
             "data_types": Counter(),
             "balance_types": Counter(),
             "sample_concepts": {},
         }
 
-        for concept_name, concept_data in self.concepts.items():
+        sample_concepts = {}
+
+        for concept_name, concept_data in self._iter_target_items("concepts"):
+            concept_stats["total_concepts"] += 1
+            if len(sample_concepts) < 5:
+                sample_concepts[concept_name] = concept_data
+
             # Analyze labels
             labels = concept_data.get("labels", {})
             for label_type in labels.keys():
@@ -175,7 +245,6 @@ class ViewerJSONAnalyzer:
             concept_stats["balance_types"][balance] += 1
 
         # Get sample concepts
-        sample_concepts = dict(list(self.concepts.items())[:5])
         for concept_name, concept_data in sample_concepts.items():
             concept_stats["sample_concepts"][concept_name] = {
                 "labels": concept_data.get("labels", {}),
@@ -215,56 +284,64 @@ class ViewerJSONAnalyzer:
         else:
             return "other"
 
-    def _count_concepts_in_tree(self, pres_data: Dict[str, Any]) -> int:
+    def _count_concepts_in_tree(self, child_map: Dict[str, List[str]]) -> int:
         """Count total concepts in presentation tree."""
-        concepts = set(pres_data.keys())
-        for children in pres_data.values():
-            for child in children:
-                concepts.add(child["t"])
+        concepts = set(child_map)
+        for children in child_map.values():
+            concepts.update(children)
         return len(concepts)
 
     def _calculate_max_depth(
-        self, pres_data: Dict[str, Any], root_concepts: List[str]
+        self, child_map: Dict[str, List[str]], root_concepts: List[str]
     ) -> int:
-        """Calculate maximum depth of presentation tree."""
-
-        def get_depth(concept: str, visited: set, depth: int = 0) -> int:
-            if concept in visited:
-                return depth
-
-            visited.add(concept)
-            max_child_depth = depth
-
-            if concept in pres_data:
-                for child in pres_data[concept]:
-                    child_concept = child["t"]
-                    child_depth = get_depth(child_concept, visited.copy(), depth + 1)
-                    max_child_depth = max(max_child_depth, child_depth)
-
-            return max_child_depth
-
-        return (
-            max(get_depth(root, set()) for root in root_concepts)
-            if root_concepts
-            else 0
-        )
+        """Calculate maximum depth of presentation tree.
+
+        Heights are memoized per concept and computed with an explicit stack,
+        so subtrees shared by several parents are walked once and deep trees
+        cannot hit the recursion limit. A child that is still being expanded
+        (a cycle back to an ancestor) counts as a leaf.
+        """
+        heights: Dict[str, int] = {}
+
+        for root in root_concepts:
+            stack = [(root, False)]
+            while stack:
+                concept, expanded = stack.pop()
+                children = child_map.get(concept, ())
+
+                if expanded:
+                    heights[concept] = max(
+                        (heights[child] + 1 for child in children), default=0
+                    )
+                    continue
+
+                if concept in heights:
+                    continue
+
+                # Placeholder while the subtree is on the stack
+                heights[concept] = 0
+                stack.append((concept, True))
+                stack.extend(
+                    (child, False) for child in children if child not in heights
+                )
+
+        return max((heights[root] for root in root_concepts), default=0)
 
     def _build_tree_structure(
         self,
         concept: str,
-        pres_data: Dict[str, Any],
+        child_map: Dict[str, List[str]],
         depth: int = 0,
         max_depth: int = 3,
     ) -> Dict[str, Any]:
         """Build tree structure for visualization."""
-        if depth >= max_depth or concept not in pres_data:
+        if depth >= max_depth or concept not in child_map:
             return {"concept": concept, "children": []}
 
         children = []
-        for child_rel in pres_data.get(concept, [])[:5]:  # Limit to first 5 children
-            child_concept = child_rel["t"]
+        for child_concept in child_map[concept][:5]:  # Limit to first 5 children
             child_tree = self._build_tree_structure(
-                child_concept, pres_data, depth + 1, max_depth
+                child_concept, child_map, depth + 1, max_depth
             )
             children.append(child_tree)
 
@@ -332,8 +409,15 @@ def main():
 
         # Optionally save detailed report
         output_path = Path(json_path).parent / "analysis_report.json"
-        with open(output_path, "w") as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            output_path.write_bytes(
+                orjson.dumps(
+                    report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+        else:
+            with open(output_path, "w") as f:
+                json.dump(report, f, indent=2)
         print(f"\nDetailed report saved to: {output_path}")
 
     except Exception as e:
@@ -8,6 +8,7 @@ the original presentation structure.
 from .input_handler import InputHandler, FilingSource
 from .arelle_processor import ArelleProcessor
 from .json_extractor import ViewerDataExtractor
+from .viewer_cache import ViewerCache
 from .data_models import Statement, Period, Row, Cell, ProcessingResult
 from .presentation_models import (
     StatementType,
@@ -28,6 +29,7 @@ __all__ = [
     "FilingSource",
     "ArelleProcessor",
     "ViewerDataExtractor",
+    "ViewerCache",
     "Statement",
     "Period",
     "Row",
@@ -4,6 +4,7 @@ Arelle processor for generating iXBRL viewer data.
 
 import subprocess
 import tempfile
+import threading
 import logging
 from pathlib import Path
 from typing import Optional
@@ -11,6 +12,11 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Arelle availability is a property of the Python environment, not of a
+# filing. Once the probe succeeds, later renders in this process skip it.
+_arelle_available = False
+_arelle_check_lock = threading.Lock()
+
 
 class ArelleError(Exception):
     """Exception for Arelle processing errors."""
@@ -32,7 +38,7 @@ class ArelleProcessor:
         self.temp_dir = temp_dir or Path(tempfile.gettempdir())
         self.timeout = timeout
 
-    def generate_viewer_html(self, filing_path: str | Path) -> str:
+    def generate_viewer_html(self, filing_path: str | Path) -> Path:
         """
         Generate iXBRL viewer HTML using Arelle.
 
@@ -95,7 +101,7 @@ class ArelleProcessor:
                 raise ArelleError("Arelle completed but viewer file was not created")
 
             logger.info(f"Successfully generated viewer HTML: {viewer_file}")
-            return str(viewer_file)
+            return viewer_file
 
         except subprocess.TimeoutExpired:
             raise ArelleError(
@@ -110,9 +116,21 @@ class ArelleProcessor:
         """
         Check if Arelle is available and has the iXBRL viewer plugin.
 
+        A successful check is remembered for the rest of the process; failures
+        are re-probed so a subsequent install_arelle() can be detected.
+
         Returns:
             True if Arelle is available, False otherwise
         """
+        global _arelle_available
+
+        with _arelle_check_lock:
+            if not _arelle_available:
+                _arelle_available = self._probe_arelle()
+            return _arelle_available
+
+    def _probe_arelle(self) -> bool:
+        """Run the Arelle command line to confirm it (and the plugin) loads."""
         try:
             # First, check if basic Arelle is available
             basic_result = subprocess.run(
@@ -4,6 +4,7 @@ Data parser for converting viewer JSON to structured data models.
 
 import logging
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Set
 
@@ -16,6 +17,20 @@ from .presentation_models import PresentationStatement, StatementType, Statement
 
 logger = logging.getLogger(__name__)
 
+# Per-process state for statement matching workers, set by the pool initializer
+# so the parser and facts are transferred once per worker rather than per task.
+_worker_state: Optional[tuple] = None
+
+
+def _init_statement_worker(parser, facts, period_selection_context) -> None:
+    global _worker_state
+    _worker_state = (parser, facts, period_selection_context)
+
+
+def _match_statement_in_worker(pres_statement):
+    parser, facts, period_selection_context = _worker_state
+    return parser._match_statement(pres_statement, facts, period_selection_context)
+
 
 class DataParser:
     """Parser for converting iXBRL viewer JSON to structured data models."""
@@ -27,6 +42,7 @@ class DataParser:
         label_style: str = "terse",
         use_scale_hint: bool = True,
         expand_dimensions: bool = True,
+        parse_workers: int = 1,
     ):
         """
         Initialize data parser.
@@ -34,6 +50,7 @@ class DataParser:
         Args:
             formatter: Value formatter for display formatting
             include_disclosures: Whether to retain disclosure/detail roles in output
+            parse_workers: Processes used to match facts to statements (1 = serial)
         """
         self.formatter = formatter or ValueFormatter()
         self.presentation_parser = PresentationParser(label_style=label_style)
@@ -43,6 +60,7 @@ class DataParser:
             expand_dimensions=expand_dimensions,
         )
         self.include_disclosures = include_disclosures
+        self.parse_workers = parse_workers
 
     def parse_viewer_data(self, viewer_data: Dict[str, Any]) -> ProcessingResult:
         """
@@ -201,19 +219,18 @@ class DataParser:
         """
         logger.info("Using presentation-based parsing")
 
-        # Parse presentation structure
+        # Parse presentation structure. Disclosure roles are filtered out before
+        # their presentation trees are built rather than discarded afterwards.
         presentation_statements = (
-            self.presentation_parser.parse_presentation_statements(viewer_data)
+            self.presentation_parser.parse_presentation_statements(
+                viewer_data, statement_filter=self._filter_presentation_statements
+            )
         )
 
         self.fact_matcher.update_concept_labels(
             self.presentation_parser.concept_label_map
         )
 
-        presentation_statements = self._filter_presentation_statements(
-            presentation_statements
-        )
-
         if not presentation_statements:
             raise ValueError("No presentation statements found in viewer data")
 
@@ -229,57 +246,19 @@ class DataParser:
         primary_tables = []
         supplemental_tables = []
 
-        for pres_statement in presentation_statements:
-            try:
-                concepts_for_statement = self._collect_concepts_from_statement(
-                    pres_statement
-                )
-
-                periods_for_statement = self.fact_matcher.extract_periods_from_facts(
-                    facts,
-                    concept_filter=(
-                        concepts_for_statement if concepts_for_statement else None
-                    ),
-                )
-
-                periods_for_statement = self._select_periods_for_statement(
-                    pres_statement,
-                    periods_for_statement,
-                    period_selection_context,
-                    facts,
-                    concepts_for_statement,
-                )
-
-                if not periods_for_statement:
-                    logger.debug(
-                        "Statement %s has no applicable periods; skipping",
-                        pres_statement.statement_name,
-                    )
-                    continue
-
-                table = self.fact_matcher.match_facts_to_statement(
-                    pres_statement, facts, periods_for_statement
-                )
-
-                if not self._statement_table_has_data(table):
-                    logger.debug(
-                        "Statement %s has no fact data; skipping",
-                        pres_statement.statement_name,
-                    )
-                    continue
-
-                if self._is_primary_statement(pres_statement):
-                    primary_tables.append(table)
-                else:
-                    supplemental_tables.append(table)
+        tables = self._match_statements(
+            presentation_statements, facts, period_selection_context
+        )
 
-                logger.info(f"Matched facts for: {pres_statement.statement_name}")
-            except Exception as e:
-                logger.warning(
-                    f"Failed to match facts for {pres_statement.statement_name}: {e}"
-                )
+        for pres_statement, table in zip(presentation_statements, tables):
+            if table is None:
                 continue
 
+            if self._is_primary_statement(pres_statement):
+                primary_tables.append(table)
+            else:
+                supplemental_tables.append(table)
+
         statement_tables = primary_tables + supplemental_tables
 
         if not statement_tables:
@@ -291,6 +270,86 @@ class DataParser:
         logger.info(f"Parsed {len(statements)} statements using presentation structure")
         return statements
 
+    def _match_statements(
+        self,
+        statements: List[PresentationStatement],
+        facts: Dict[str, Any],
+        period_selection_context: Dict[str, Any],
+    ) -> List[Optional[StatementTable]]:
+        """Match facts to each statement, in a process pool when configured.
+
+        Statements are independent of each other, so large filings rendered
+        with disclosures can spread the matching across ``parse_workers``
+        processes. Results are returned in statement order.
+        """
+        workers = min(self.parse_workers, len(statements))
+        if workers <= 1:
+            return [
+                self._match_statement(statement, facts, period_selection_context)
+                for statement in statements
+            ]
+
+        logger.info(f"Matching {len(statements)} statements with {workers} workers")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_statement_worker,
+            initargs=(self, facts, period_selection_context),
+        ) as executor:
+            return list(executor.map(_match_statement_in_worker, statements))
+
+    def _match_statement(
+        self,
+        pres_statement: PresentationStatement,
+        facts: Dict[str, Any],
+        period_selection_context: Dict[str, Any],
+    ) -> Optional[StatementTable]:
+        """Build the fact table for one statement, or None when it has no data."""
+        try:
+            concepts_for_statement = self._collect_concepts_from_statement(
+                pres_statement
+            )
+
+            periods_for_statement = self.fact_matcher.extract_periods_from_facts(
+                facts,
+                concept_filter=(
+                    concepts_for_statement if concepts_for_statement else None
+                ),
+            )
+
+            periods_for_statement = self._select_periods_for_statement(
+                pres_statement,
+                periods_for_statement,
+                period_selection_context,
+                facts,
+                concepts_for_statement,
+            )
+
+            if not periods_for_statement:
+                logger.debug(
+                    "Statement %s has no applicable periods; skipping",
+                    pres_statement.statement_name,
+                )
+                return None
+
+            table = self.fact_matcher.match_facts_to_statement(
+                pres_statement, facts, periods_for_statement
+            )
+
+            if not self._statement_table_has_data(table):
+                logger.debug(
+                    "Statement %s has no fact data; skipping",
+                    pres_statement.statement_name,
+                )
+                return None
+
+            logger.info(f"Matched facts for: {pres_statement.statement_name}")
+            return table
+        except Exception as e:
+            logger.warning(
+                f"Failed to match facts for {pres_statement.statement_name}: {e}"
+            )
+            return None
+
     def _is_primary_statement(self, statement) -> bool:
         """Check if this is a primary financial statement.
 
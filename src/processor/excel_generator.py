@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import List
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import Alignment, Font, Border, Side
 
@@ -15,6 +16,21 @@ from .data_models import Statement, ProcessingResult
 
 logger = logging.getLogger(__name__)
 
+# Shared style objects; openpyxl deduplicates styles per workbook, so reusing
+# one instance avoids allocating a new Font/Border/Alignment for every cell.
+HEADER_FONT = Font(bold=True, size=11)
+ABSTRACT_FONT = Font(bold=True, size=10)
+NORMAL_FONT = Font(size=10)
+BOLD_FONT = Font(bold=True)
+CENTER_ALIGNMENT = Alignment(horizontal="center")
+RIGHT_ALIGNMENT = Alignment(horizontal="right")
+INDENT_ALIGNMENTS = [Alignment(indent=level) for level in range(16)]
+TOP_BORDER = Border(top=Side(style="thin"))
+BOTTOM_BORDER = Border(bottom=Side(style="thin"))
+TITLE_FONT = Font(bold=True, size=14)
+SECTION_FONT = Font(bold=True, size=12)
+WARNING_FONT = Font(bold=True, size=12, color="FF6600")
+
 
 class ExcelGenerator:
     """Generates Excel files from processed financial statements."""
@@ -41,11 +57,10 @@ class ExcelGenerator:
             raise ValueError("Cannot generate Excel from failed processing result")
 
         try:
-            # Create workbook
-            wb = Workbook()
-
-            # Remove default sheet
-            wb.remove(wb.active)
+            # Write-only workbooks stream each row to disk as it is appended
+            # instead of keeping every cell object in memory until save().
+            # Rows must therefore be written top to bottom, exactly once.
+            wb = Workbook(write_only=True)
 
             # Add sheet for each statement
             for statement in result.statements:
@@ -90,15 +105,15 @@ class ExcelGenerator:
             logger.warning(f"No periods found for statement: {statement.name}")
             return
 
+        # Sheet layout must be set before the first row is streamed out
+        self._format_sheet(ws, len(periods))
+
         # Set up headers
         self._write_headers(ws, periods)
 
         # Write data rows
         self._write_statement_rows(ws, statement, periods)
 
-        # Apply formatting
-        self._format_sheet(ws, len(periods))
-
     def _clean_sheet_name(self, name: str) -> str:
         """
         Clean sheet name for Excel compatibility.
@@ -121,147 +136,152 @@ class ExcelGenerator:
 
     def _write_headers(self, ws, periods: List) -> None:
         """
-        Write column headers.
+        Append the styled column header rows.
 
         Args:
             ws: Worksheet object
             periods: List of periods
         """
-        # Row 1: Statement title (will be set later if needed)
+        # Row 1: Statement title (left blank for now)
         # Row 2: Period headers
-        ws["A2"] = "Item"
-
-        for i, period in enumerate(periods, start=2):
-            col_letter = get_column_letter(i)
-            # Use period label or end_date
-            period_label = getattr(period, "label", "") or getattr(
-                period, "end_date", ""
-            )
-            ws[f"{col_letter}2"] = period_label
+        ws.append([])
+
+        headers = ["Item"] + [self._period_key(period) for period in periods]
+        ws.append(
+            [
+                self._styled_cell(
+                    ws,
+                    header,
+                    font=HEADER_FONT,
+                    alignment=CENTER_ALIGNMENT,
+                    border=BOTTOM_BORDER,
+                )
+                for header in headers
+            ]
+        )
 
     def _write_statement_rows(self, ws, statement: Statement, periods: List) -> None:
         """
-        Write statement data rows.
+        Append statement data rows, styling each cell as it is built.
 
         Args:
             ws: Worksheet object
             statement: Statement data
             periods: List of periods to include
         """
-        row_num = 3  # Start after headers
+        period_keys = [self._period_key(period) for period in periods]
 
         for row in statement.rows:
             presentation_node = getattr(row, "presentation_node", None)
-
-            # Column A: Item label with indentation and styling
-            label_cell = ws.cell(row=row_num, column=1)
-            label_cell.value = row.label
+            label_font = None
+            label_alignment = None
+            label_border = None
+            value_border = None
 
             if presentation_node:
-                indent_level = max(0, min(15, presentation_node.depth))
-                label_cell.alignment = Alignment(indent=indent_level)
+                label_alignment = INDENT_ALIGNMENTS[
+                    max(0, min(15, presentation_node.depth))
+                ]
 
                 if presentation_node.abstract:
-                    label_cell.font = Font(bold=True)
-                elif presentation_node.preferred_label_role:
-                    role = presentation_node.preferred_label_role.lower()
-                    if "total" in role or "subtotal" in role:
-                        label_cell.font = Font(bold=True)
-                        label_cell.border = Border(top=Side(style="thin"))
+                    label_font = BOLD_FONT
+                elif self._is_total_node(presentation_node):
+                    label_font = BOLD_FONT
+                    label_border = TOP_BORDER
+
+                # Highlight totals/subtotals using preferred label metadata
+                if self._is_total_node(presentation_node):
+                    value_border = TOP_BORDER
             else:
                 # Legacy fallback using existing heuristics
                 depth = getattr(row, "depth", 0)
                 if depth:
-                    label_cell.alignment = Alignment(indent=max(0, min(15, depth)))
+                    label_alignment = INDENT_ALIGNMENTS[max(0, min(15, depth))]
                 if getattr(row, "is_abstract", False):
-                    label_cell.font = Font(bold=True)
+                    label_font = BOLD_FONT
 
-            # Data columns
-            for i, period in enumerate(periods, start=2):
-                # Get cell value for this period
-                period_key = getattr(period, "label", "") or getattr(
-                    period, "end_date", ""
+            # Rows without explicit styling fall back to label heuristics
+            if label_font is None:
+                label_font = NORMAL_FONT
+                if self._is_abstract_row(str(row.label or "")):
+                    label_font = ABSTRACT_FONT
+                    label_border = value_border = BOTTOM_BORDER
+
+            # Column A: Item label with indentation and styling
+            cells = [
+                self._styled_cell(
+                    ws,
+                    row.label,
+                    font=label_font,
+                    alignment=label_alignment,
+                    border=label_border,
                 )
-                cell_data = row.cells.get(period_key)
+            ]
 
-                cell = ws.cell(row=row_num, column=i)
+            # Data columns
+            for period_key in period_keys:
+                cell_data = row.cells.get(period_key)
+                number_format = None
 
                 if cell_data and cell_data.value is not None:
+                    value = cell_data.value
                     try:
                         if cell_data.raw_value is not None:
-                            cell.value = float(cell_data.raw_value)
-                        else:
-                            cell.value = cell_data.value
+                            value = float(cell_data.raw_value)
                     except (ValueError, TypeError):
-                        cell.value = cell_data.value
+                        pass
 
                     # Apply numeric formatting based on unit hints
                     if cell_data.raw_value is not None:
-                        unit = (cell_data.unit or "").lower()
-                        if "usd" in unit:
-                            cell.number_format = "#,##0.0_);(#,##0.0)"
-                        elif "shares" in unit:
-                            cell.number_format = "#,##0"
-                        elif unit in {"percent", "%"}:
-                            cell.number_format = "0.00%"
+                        number_format = self._number_format(cell_data.unit)
                 else:
-                    cell.value = "—"
-
-                # Highlight totals/subtotals using preferred label metadata
-                if presentation_node and presentation_node.preferred_label_role:
-                    role = presentation_node.preferred_label_role.lower()
-                    if "total" in role or "subtotal" in role:
-                        cell.border = Border(top=Side(style="thin"))
+                    value = "—"
+
+                cells.append(
+                    self._styled_cell(
+                        ws,
+                        value,
+                        font=NORMAL_FONT,
+                        alignment=RIGHT_ALIGNMENT,
+                        border=value_border,
+                        number_format=number_format,
+                    )
+                )
 
-            row_num += 1
+            ws.append(cells)
+
+    @staticmethod
+    def _styled_cell(
+        ws,
+        value,
+        font=None,
+        alignment=None,
+        border=None,
+        number_format=None,
+    ) -> WriteOnlyCell:
+        """Build a write-only cell, assigning only the styles that are set."""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        if number_format:
+            cell.number_format = number_format
+        return cell
 
     def _format_sheet(self, ws, num_periods: int) -> None:
         """
-        Apply formatting to the worksheet.
+        Apply sheet-level layout to the worksheet.
+
+        Cell styles are applied while rows are built, so this only sets column
+        widths and frozen panes. It must run before any row is appended.
 
         Args:
             ws: Worksheet object
             num_periods: Number of period columns
         """
-        # Define styles
-        header_font = Font(bold=True, size=11)
-        abstract_font = Font(bold=True, size=10)
-        normal_font = Font(size=10)
-
-        thin_border = Border(bottom=Side(style="thin"))
-
-        # Header formatting (row 2)
-        for col in range(1, num_periods + 2):  # +2 for label column
-            cell = ws.cell(row=2, column=col)
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = thin_border
-
-        # Data rows formatting
-        max_row = ws.max_row
-        for row in range(3, max_row + 1):
-            # Label column (A)
-            label_cell = ws.cell(row=row, column=1)
-
-            # Preserve explicit styling applied during row write; otherwise fall back
-            if not label_cell.font or not label_cell.font.bold:
-                label_cell.font = normal_font
-
-            label_text = str(label_cell.value or "")
-            if label_text and (label_cell.font and label_cell.font.bold):
-                # Ensure bold rows maintain a separator if not already applied
-                pass
-            elif self._is_abstract_row(label_text):
-                label_cell.font = abstract_font
-                for col in range(1, num_periods + 2):
-                    ws.cell(row=row, column=col).border = thin_border
-
-            # Data columns
-            for col in range(2, num_periods + 2):
-                data_cell = ws.cell(row=row, column=col)
-                data_cell.font = normal_font
-                data_cell.alignment = Alignment(horizontal="right")
-
         # Set column widths
         ws.column_dimensions["A"].width = 50  # Item labels
         for col in range(2, num_periods + 2):
@@ -271,6 +291,29 @@ class ExcelGenerator:
         # Freeze panes (freeze first column and header row)
         ws.freeze_panes = "B3"
 
+    @staticmethod
+    def _period_key(period) -> str:
+        """Return the header label / cell lookup key for a period."""
+        return getattr(period, "label", "") or getattr(period, "end_date", "")
+
+    @staticmethod
+    def _is_total_node(presentation_node) -> bool:
+        """Check whether a presentation node uses a total/subtotal label role."""
+        role = (presentation_node.preferred_label_role or "").lower()
+        return "total" in role or "subtotal" in role
+
+    @staticmethod
+    def _number_format(unit) -> str:
+        """Return the Excel number format implied by a unit hint."""
+        unit = (unit or "").lower()
+        if "usd" in unit:
+            return "#,##0.0_);(#,##0.0)"
+        if "shares" in unit:
+            return "#,##0"
+        if unit in {"percent", "%"}:
+            return "0.00%"
+        return ""
+
     def _is_abstract_row(self, label: str) -> bool:
         """
         Determine if a row is an abstract/section header.
@@ -314,39 +357,38 @@ class ExcelGenerator:
         """
         ws = wb.create_sheet(title="Summary", index=0)
 
-        # Company and filing info
-        ws["A1"] = "Company Information"
-        ws["A1"].font = Font(bold=True, size=14)
-
-        ws["A3"] = "Company:"
-        ws["B3"] = result.company_name
-
-        ws["A4"] = "Form Type:"
-        ws["B4"] = result.form_type
+        # Set column widths
+        ws.column_dimensions["A"].width = 20
+        ws.column_dimensions["B"].width = 30
+        ws.column_dimensions["C"].width = 20
 
-        ws["A5"] = "Filing Date:"
-        ws["B5"] = result.filing_date
+        # Company and filing info (rows 1-5)
+        ws.append([self._styled_cell(ws, "Company Information", font=TITLE_FONT)])
+        ws.append([])
+        ws.append(["Company:", result.company_name])
+        ws.append(["Form Type:", result.form_type])
+        ws.append(["Filing Date:", result.filing_date])
+        ws.append([])
 
-        # Statements info
-        ws["A7"] = "Financial Statements"
-        ws["A7"].font = Font(bold=True, size=12)
+        # Statements info (row 7, listing from row 9)
+        ws.append([self._styled_cell(ws, "Financial Statements", font=SECTION_FONT)])
+        ws.append([])
 
-        row = 9
         for i, statement in enumerate(result.statements, 1):
-            ws[f"A{row}"] = f"{i}. {statement.name}"
-            ws[f"B{row}"] = f"{len(statement.periods)} periods"
-            ws[f"C{row}"] = f"{len(statement.rows)} line items"
-            row += 1
+            ws.append(
+                [
+                    f"{i}. {statement.name}",
+                    f"{len(statement.periods)} periods",
+                    f"{len(statement.rows)} line items",
+                ]
+            )
 
-        # Warnings if any
+        # Warnings if any, two rows below the statement list
         if result.warnings:
-            ws[f"A{row + 2}"] = "Warnings"
-            ws[f"A{row + 2}"].font = Font(bold=True, size=12, color="FF6600")
-
-            for i, warning in enumerate(result.warnings):
-                ws[f"A{row + 4 + i}"] = f"• {warning}"
+            ws.append([])
+            ws.append([])
+            ws.append([self._styled_cell(ws, "Warnings", font=WARNING_FONT)])
+            ws.append([])
 
-        # Set column widths
-        ws.column_dimensions["A"].width = 20
-        ws.column_dimensions["B"].width = 30
-        ws.column_dimensions["C"].width = 20
+            for warning in result.warnings:
+                ws.append([f"• {warning}"])
@@ -5,13 +5,22 @@ Input handler for processing various filing sources.
 import tempfile
 import zipfile
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import urlparse
 
 import requests
 
 
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Return the process-wide session so URL sources reuse pooled connections."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "SECDataExtractor v3.0 user@example.com"
+    return session
+
+
 class FilingSource(ABC):
     """Abstract base class for filing sources."""
 
@@ -34,12 +43,13 @@ class FilingSource(ABC):
 class LocalFileSource(FilingSource):
     """Handler for local iXBRL files."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: Union[str, Path]):
         self.file_path = Path(file_path)
 
     def validate(self) -> bool:
         """Validate local file exists and is readable."""
-        return self.file_path.exists() and self.file_path.is_file()
+        # is_file() is False for missing paths, so one stat covers both checks
+        return self.file_path.is_file()
 
     def get_path(self) -> str:
         """Return the local file path."""
@@ -68,9 +78,8 @@ class URLSource(FilingSource):
         if self.temp_file and self.temp_file.exists():
             return str(self.temp_file)
 
-        # Download the file with proper User-Agent for SEC
-        headers = {"User-Agent": "SECDataExtractor v3.0 user@example.com"}
-        response = requests.get(self.url, headers=headers, timeout=30)
+        # Download over the shared session (sends the SEC User-Agent)
+        response = _get_session().get(self.url, timeout=30)
         response.raise_for_status()
 
         # Save to temp file
@@ -88,7 +97,7 @@ class URLSource(FilingSource):
 class ZipSource(FilingSource):
     """Handler for ZIP archives containing filing documents."""
 
-    def __init__(self, zip_path: str, temp_dir: Optional[Path] = None):
+    def __init__(self, zip_path: Union[str, Path], temp_dir: Optional[Path] = None):
         self.zip_path = Path(zip_path)
         self.temp_dir = temp_dir or Path(tempfile.gettempdir())
         self.extract_dir: Optional[Path] = None
@@ -96,7 +105,8 @@ class ZipSource(FilingSource):
 
     def validate(self) -> bool:
         """Validate ZIP file exists and is readable."""
-        return self.zip_path.exists() and zipfile.is_zipfile(self.zip_path)
+        # is_zipfile() returns False when the archive cannot be opened
+        return zipfile.is_zipfile(self.zip_path)
 
     def get_path(self) -> str:
         """Extract ZIP and find the main filing document."""
@@ -110,18 +120,23 @@ class ZipSource(FilingSource):
         # Extract ZIP
         with zipfile.ZipFile(self.zip_path, "r") as zip_ref:
             zip_ref.extractall(self.extract_dir)
-
-        # Find the main filing document (largest .htm/.html file)
-        html_files = list(self.extract_dir.glob("*.htm")) + list(
-            self.extract_dir.glob("*.html")
-        )
-
-        if not html_files:
+            members = zip_ref.infolist()
+
+        # Find the main filing document (largest top-level .htm/.html file).
+        # Choosing from this archive's own listing ignores files left in the
+        # extract directory by earlier runs, and its sizes need no stat() calls.
+        largest_size = -1
+        for member in members:
+            name = member.filename
+            if "/" in name or not name.endswith((".htm", ".html")):
+                continue
+            if member.file_size > largest_size:
+                largest_size = member.file_size
+                self.filing_file = self.extract_dir / name
+
+        if self.filing_file is None:
             raise ValueError("No HTML files found in ZIP archive")
 
-        # Pick the largest HTML file (usually the main filing)
-        self.filing_file = max(html_files, key=lambda p: p.stat().st_size)
-
         return str(self.filing_file)
 
     def cleanup(self) -> None:
@@ -135,14 +150,27 @@ class ZipSource(FilingSource):
 class InputHandler:
     """Handler for various types of filing inputs."""
 
+    # Leading bytes inspected by validate_filing
+    FILING_SNIFF_BYTES = 10000
+    # Basic iXBRL/HTML indicators (lowercase)
+    FILING_INDICATORS = (b"<html", b"xbrl", b"edgar", b"sec.gov")
+
+    # Prefixes that mark a filing input as a remote URL
+    URL_PREFIXES = ("http://", "https://")
+
     def __init__(self, temp_dir: Optional[Path] = None):
         self.temp_dir = temp_dir or Path(tempfile.gettempdir())
 
-    def create_source(self, input_path: str) -> FilingSource:
+    @classmethod
+    def is_url(cls, input_path: Union[str, Path]) -> bool:
+        """Return True if the filing input is a URL rather than a local path."""
+        return isinstance(input_path, str) and input_path.startswith(cls.URL_PREFIXES)
+
+    def create_source(self, input_path: Union[str, Path]) -> FilingSource:
         """Create appropriate FilingSource based on input type."""
 
         # URL
-        if input_path.startswith(("http://", "https://")):
+        if self.is_url(input_path):
             return URLSource(input_path, self.temp_dir)
 
         # Local file
@@ -152,23 +180,20 @@ class InputHandler:
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
         # ZIP archive
-        if input_path.lower().endswith(".zip"):
-            return ZipSource(input_path, self.temp_dir)
+        if input_file.suffix.lower() == ".zip":
+            return ZipSource(input_file, self.temp_dir)
 
         # Regular file
-        return LocalFileSource(input_path)
+        return LocalFileSource(input_file)
 
-    def validate_filing(self, file_path: str) -> bool:
+    def validate_filing(self, file_path: Union[str, Path]) -> bool:
         """Basic validation that file looks like an iXBRL filing."""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read(10000)  # Read first 10KB
-
-            # Check for basic iXBRL/HTML indicators
-            indicators = ["<html", "xbrl", "edgar", "sec.gov"]
+            # Sniff the raw head; bytes.lower() avoids decoding the text first
+            with open(file_path, "rb") as f:
+                head = f.read(self.FILING_SNIFF_BYTES).lower()
 
-            content_lower = content.lower()
-            return any(indicator in content_lower for indicator in indicators)
+            return any(indicator in head for indicator in self.FILING_INDICATORS)
 
         except Exception:
             return False
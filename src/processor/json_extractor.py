@@ -6,7 +6,12 @@ import json
 import re
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
@@ -19,7 +24,9 @@ class ViewerDataExtractor:
         pass
 
     def extract_viewer_data(
-        self, viewer_html_path: str, meta_links_candidates: Optional[List[Path]] = None
+        self,
+        viewer_html_path: Union[str, Path],
+        meta_links_candidates: Optional[List[Path]] = None,
     ) -> Dict[str, Any]:
         """
         Extract viewer JSON data from HTML file.
@@ -140,13 +147,17 @@ class ViewerDataExtractor:
         candidates.extend(extra_candidates)
 
         for candidate in candidates:
-            if not candidate or not candidate.exists():
+            if not candidate:
                 continue
 
+            # Opening directly costs one syscall; probing exists() first would add
+            # a stat for every candidate, including ones the caller already checked.
             try:
-                with candidate.open("r", encoding="utf-8") as fp:
-                    logger.debug("Loaded MetaLinks from %s", candidate)
-                    return json.load(fp)
+                meta_links = self._load_json_file(candidate)
+                logger.debug("Loaded MetaLinks from %s", candidate)
+                return meta_links
+            except (FileNotFoundError, IsADirectoryError):
+                continue
             except Exception as exc:
                 logger.warning(
                     "Failed to parse MetaLinks.json at %s: %s", candidate, exc
@@ -154,6 +165,14 @@ class ViewerDataExtractor:
 
         return None
 
+    @staticmethod
+    def _load_json_file(path: Path) -> Any:
+        """Parse a JSON file with orjson when available, else the stdlib module."""
+        raw = path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
     def _build_role_map(
         self, meta_links: Dict[str, Any], instance_name: str
     ) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
@@ -6,6 +6,7 @@ enabling exact visual fidelity with the original filing presentation.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
@@ -222,8 +223,13 @@ class StatementTable:
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=1024)
 def classify_statement_type(statement_name: str) -> StatementType:
-    """Classify statement type from statement name."""
+    """Classify statement type from statement name.
+
+    Role names repeat across filings ("Consolidated Balance Sheets"), so
+    results are memoized and batch runs scan each distinct name once.
+    """
     name_lower = statement_name.lower()
 
     if "balance sheet" in name_lower or "position" in name_lower:
@@ -8,7 +8,7 @@ visual fidelity of the original filing.
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .presentation_models import (
     PresentationNode,
@@ -18,6 +18,9 @@ from .presentation_models import (
 
 logger = logging.getLogger(__name__)
 
+# Chooses which statements to keep, given them before their trees are built
+StatementFilter = Callable[[List[PresentationStatement]], List[PresentationStatement]]
+
 
 class PresentationParser:
     """Parse presentation relationships from viewer JSON data."""
@@ -42,12 +45,15 @@ class PresentationParser:
         self.concept_label_map: Dict[str, Dict[str, str]] = {}
 
     def parse_presentation_statements(
-        self, viewer_data: dict
+        self, viewer_data: dict, statement_filter: Optional[StatementFilter] = None
     ) -> List[PresentationStatement]:
         """Extract all financial statements from presentation linkbase.
 
         Args:
             viewer_data: Complete viewer JSON structure from Arelle
+            statement_filter: Optional callable selecting (and ordering) the
+                statements to keep. It receives statements without root nodes,
+                so presentation trees are only built for the roles it returns.
 
         Returns:
             List of PresentationStatement objects representing financial statements
@@ -71,7 +77,9 @@ class PresentationParser:
 
             logger.info(f"Found {len(pres_rels)} presentation roles")
 
-            # Parse each role that represents a financial statement
+            # Resolve the cheap role metadata for every financial statement role
+            headers: Dict[str, Tuple[List[str], Dict[str, dict]]] = {}
+            candidates: List[PresentationStatement] = []
             for role_id, role_data in pres_rels.items():
                 role_def = role_defs.get(role_id, {})
 
@@ -79,15 +87,33 @@ class PresentationParser:
                     continue
 
                 try:
-                    statement = self._parse_single_statement(
-                        role_id, role_data, role_def, concepts, role_metadata
+                    statement, root_concepts, relationships = (
+                        self._parse_statement_header(
+                            role_id, role_data, role_def, role_metadata
+                        )
                     )
-                    statements.append(statement)
-                    logger.info(f"Parsed statement: {statement.statement_name}")
                 except Exception as e:
                     logger.warning(f"Failed to parse statement {role_id}: {e}")
                     continue
 
+                headers[role_id] = (root_concepts, relationships)
+                candidates.append(statement)
+
+            # Build presentation trees only for the statements that were kept
+            kept = statement_filter(candidates) if statement_filter else candidates
+            statements = self._build_statements(kept, headers, concepts)
+
+            # The filter picked roles before knowing whether their trees build. If
+            # none of them did, fall back to every statement that can be built,
+            # as filtering the built statements would have done.
+            if not statements and statement_filter is not None:
+                attempted = {statement.role_id for statement in kept}
+                statements = self._build_statements(
+                    [s for s in candidates if s.role_id not in attempted],
+                    headers,
+                    concepts,
+                )
+
         except Exception as e:
             logger.error(f"Error parsing presentation statements: {e}")
             raise
@@ -95,6 +121,36 @@ class PresentationParser:
         logger.info(f"Successfully parsed {len(statements)} statements")
         return statements
 
+    def _build_statements(
+        self,
+        statements: List[PresentationStatement],
+        headers: Dict[str, Tuple[List[str], Dict[str, dict]]],
+        concepts: dict,
+    ) -> List[PresentationStatement]:
+        """Build presentation trees, dropping statements whose trees fail.
+
+        Args:
+            statements: Statements returned by _parse_statement_header
+            headers: Root concepts and relationships keyed by role ID
+            concepts: Concept definitions with labels
+
+        Returns:
+            The statements whose trees were built, in their original order
+        """
+        built: List[PresentationStatement] = []
+        for statement in statements:
+            root_concepts, relationships = headers[statement.role_id]
+            try:
+                self._build_statement_trees(
+                    statement, root_concepts, relationships, concepts
+                )
+            except Exception as e:
+                logger.warning(f"Failed to parse statement {statement.role_id}: {e}")
+                continue
+            built.append(statement)
+            logger.info(f"Parsed statement: {statement.statement_name}")
+        return built
+
     def _is_financial_statement_role(self, role_def: dict) -> bool:
         """Check if this role represents a presentation we should surface.
 
@@ -159,6 +215,30 @@ class PresentationParser:
         Returns:
             Complete PresentationStatement with hierarchical structure
         """
+        statement, root_concepts, relationships = self._parse_statement_header(
+            role_id, role_data, role_def, role_metadata
+        )
+        self._build_statement_trees(statement, root_concepts, relationships, concepts)
+        return statement
+
+    def _parse_statement_header(
+        self,
+        role_id: str,
+        role_data: dict,
+        role_def: dict,
+        role_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Tuple[PresentationStatement, List[str], Dict[str, dict]]:
+        """Resolve a statement's name, type and MetaLinks metadata.
+
+        Args:
+            role_id: Short role ID (e.g., "ns9")
+            role_data: Presentation relationships for this role
+            role_def: Role definition with URI and label
+            role_metadata: Optional MetaLinks role lookup tables
+
+        Returns:
+            Tuple of (statement without root nodes, root concepts, relationships)
+        """
         logger.debug(f"Parsing statement for role {role_id}")
 
         root_concepts, relationships = self._normalize_role_data(role_data)
@@ -168,21 +248,6 @@ class PresentationParser:
 
         logger.debug(f"Found {len(root_concepts)} root concepts: {root_concepts}")
 
-        # Build presentation trees for each root concept
-        root_nodes = []
-        for root_concept in root_concepts:
-            try:
-                node = self._build_presentation_tree(
-                    root_concept, relationships, concepts, depth=0
-                )
-                root_nodes.append(node)
-            except Exception as e:
-                logger.warning(f"Failed to build tree for {root_concept}: {e}")
-                continue
-
-        if not root_nodes:
-            raise ValueError(f"No valid presentation trees built for role {role_id}")
-
         role_uri = role_def.get("uri")
         if not role_uri:
             elrs = role_data.get("elrs") or {}
@@ -221,18 +286,53 @@ class PresentationParser:
         )
         statement_type = classify_statement_type(statement_name)
 
-        return PresentationStatement(
+        statement = PresentationStatement(
             role_uri=role_uri or role_def.get("uri", "") or "",
             role_id=role_id,
             statement_name=statement_name,
             statement_type=statement_type,
-            root_nodes=root_nodes,
+            root_nodes=[],
             r_id=metadata.get("r_id") if metadata else None,
             group_type=metadata.get("groupType") if metadata else None,
             sub_group_type=metadata.get("subGroupType") if metadata else None,
             role_order=metadata.get("order") if metadata else None,
             long_name=metadata.get("longName") if metadata else None,
         )
+        return statement, root_concepts, relationships
+
+    def _build_statement_trees(
+        self,
+        statement: PresentationStatement,
+        root_concepts: List[str],
+        relationships: Dict[str, dict],
+        concepts: dict,
+    ) -> None:
+        """Populate a statement's root nodes from its presentation relationships.
+
+        Args:
+            statement: Statement returned by _parse_statement_header
+            root_concepts: Root concept names for the role
+            relationships: Normalized relationship map for the role
+            concepts: Concept definitions with labels
+        """
+        # Build presentation trees for each root concept
+        root_nodes = []
+        for root_concept in root_concepts:
+            try:
+                node = self._build_presentation_tree(
+                    root_concept, relationships, concepts, depth=0
+                )
+                root_nodes.append(node)
+            except Exception as e:
+                logger.warning(f"Failed to build tree for {root_concept}: {e}")
+                continue
+
+        if not root_nodes:
+            raise ValueError(
+                f"No valid presentation trees built for role {statement.role_id}"
+            )
+
+        statement.root_nodes = root_nodes
 
     def _normalize_role_data(
         self, role_data: dict
@@ -0,0 +1,148 @@
+"""
+On-disk cache for extracted iXBRL viewer data.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever ViewerDataExtractor changes the shape of its output so stale
+# entries are ignored instead of being fed to the parser.
+CACHE_VERSION = 1
+
+# Distributions whose versions change what Arelle writes into the viewer data
+TOOL_DISTRIBUTIONS = ("arelle-release", "ixbrl-viewer")
+
+# Extension taxonomy files (schema and linkbases) Arelle loads from the
+# filing's directory as part of its DTS
+DTS_SUFFIXES = (".xsd", "_pre.xml", "_lab.xml", "_cal.xml", "_def.xml")
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "sec_extractor"
+    / "viewer"
+)
+
+# Cache directories already created by this process; batch renders store one
+# entry per filing into the same directory and only need to mkdir it once.
+_created_dirs: Set[Path] = set()
+
+
+@lru_cache(maxsize=1)
+def _tool_versions() -> str:
+    """Describe the installed Arelle toolchain; looked up once per process."""
+    versions = []
+    for name in TOOL_DISTRIBUTIONS:
+        try:
+            versions.append(f"{name}={metadata.version(name)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{name}=missing")
+    return ";".join(versions)
+
+
+def _dts_paths(filing_path: Path) -> List[Path]:
+    """Return the schema and linkbase files beside a filing, sorted by name."""
+    try:
+        with os.scandir(filing_path.parent) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(DTS_SUFFIXES) and entry.is_file()
+            ]
+    except OSError:
+        return []
+    return [filing_path.parent / name for name in sorted(names)]
+
+
+class ViewerCache:
+    """Stores viewer JSON payloads keyed by a hash of the filing inputs.
+
+    Running Arelle is by far the slowest step of a render. Its output depends on
+    the filing document, the extension schema and linkbases next to it (the
+    filing's DTS), any MetaLinks.json and the installed Arelle and iXBRL viewer
+    versions. Hashing all of those lets repeat runs over the same filings skip
+    Arelle entirely, while a re-downloaded linkbase or an upgrade misses.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    def make_key(
+        self,
+        filing_path: Union[str, Path],
+        extra_paths: Iterable[Union[str, Path]] = (),
+    ) -> str:
+        """
+        Build a cache key from the contents of the filing and its companions.
+
+        Args:
+            filing_path: Local filing document or ZIP package
+            extra_paths: Additional inputs (e.g. MetaLinks.json) that affect the output
+
+        Returns:
+            Hex digest identifying this exact set of inputs and tool versions
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{CACHE_VERSION};{_tool_versions()}".encode())
+
+        filing_path = Path(filing_path)
+        for path in (filing_path, *extra_paths, *_dts_paths(filing_path)):
+            path = Path(path)
+            with path.open("rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                digest.update(f"{path.name}:{size};".encode("utf-8"))
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached viewer data for ``key`` or None on a miss."""
+        cache_path = self._path_for(key)
+
+        try:
+            with cache_path.open("r", encoding="utf-8") as handle:
+                viewer_data = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "Ignoring unreadable viewer cache entry %s: %s", cache_path, exc
+            )
+            return None
+
+        logger.debug("Viewer cache hit: %s", cache_path)
+        return viewer_data
+
+    def store(self, key: str, viewer_data: Dict[str, Any]) -> None:
+        """Persist viewer data for ``key``; failures are logged, never raised."""
+        cache_path = self._path_for(key)
+        # Write to a private file and rename so concurrent renders of the same
+        # filing never observe a partially written entry.
+        temp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+
+        try:
+            if self.cache_dir not in _created_dirs:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                _created_dirs.add(self.cache_dir)
+            with temp_path.open("w", encoding="utf-8") as handle:
+                json.dump(viewer_data, handle)
+            os.replace(temp_path, cache_path)
+            logger.debug("Viewer cache stored: %s", cache_path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Failed to write viewer cache entry %s: %s", cache_path, exc)
+            temp_path.unlink(missing_ok=True)
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
@@ -10,9 +10,11 @@ Handles communication with SEC EDGAR database including:
 
 import json
 import logging
+import sys
+import time
 import requests
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Sequence
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -42,21 +44,33 @@ class EdgarClient:
     BASE_URL = "https://www.sec.gov"
     DATA_URL = "https://data.sec.gov"
     ARCHIVES_URL = f"{BASE_URL}/Archives/edgar/data"
+    # Seconds a failed ticker index download is remembered before retrying, so a
+    # batch of lookups during an EDGAR outage does not pay every timeout again
+    TICKER_INDEX_RETRY_SECONDS = 30.0
 
-    def __init__(self, user_agent: Optional[str] = None, requests_per_second: int = 8):
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        requests_per_second: int = 8,
+        max_connections: int = 10,
+    ):
         """
         Initialize EDGAR client.
 
         Args:
             user_agent: Custom user agent string (SEC requires identification)
             requests_per_second: Rate limit (SEC allows 10/sec, we use 8 for safety)
+            max_connections: Keep-alive connections pooled per host; size this to the
+                number of parallel downloads so workers never open fresh sockets
         """
         self.user_agent = user_agent or get_user_agent()
         self.rate_limiter = RateLimiter(max_requests=requests_per_second)
         self._ticker_cache: Dict[str, Company] = {}
         self._ticker_index_loaded = False
+        self._ticker_index_failure: Optional[Tuple[float, str]] = None
 
-        # Configure requests session with retries
+        # Configure a single keep-alive session with retries; every request made by
+        # this client (searches, index lookups, downloads) reuses its connection pool
         self.session = requests.Session()
 
         retry_strategy = Retry(
@@ -66,7 +80,12 @@ class EdgarClient:
             allowed_methods=["GET"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        pool_size = max(1, max_connections)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry_strategy,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -75,6 +94,7 @@ class EdgarClient:
             {
                 "User-Agent": self.user_agent,
                 "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
             }
         )
 
@@ -118,6 +138,11 @@ class EdgarClient:
         if self._ticker_index_loaded:
             return
 
+        if self._ticker_index_failure:
+            failed_at, message = self._ticker_index_failure
+            if time.monotonic() - failed_at < self.TICKER_INDEX_RETRY_SECONDS:
+                raise EdgarError(message)
+
         urls = [
             f"{self.BASE_URL}/files/company_tickers.json",
             f"{self.DATA_URL}/company_tickers.json",
@@ -185,9 +210,13 @@ class EdgarClient:
                 continue
 
         if not self._ticker_index_loaded:
-            if last_error:
-                raise EdgarError(str(last_error))
-            raise EdgarError("Could not access any company tickers endpoint")
+            message = (
+                str(last_error)
+                if last_error
+                else "Could not access any company tickers endpoint"
+            )
+            self._ticker_index_failure = (time.monotonic(), message)
+            raise EdgarError(message)
 
     def lookup_company_by_ticker(self, ticker: str) -> Optional[Company]:
         """
@@ -411,12 +440,22 @@ class EdgarClient:
             report_dates = recent_filings.get("reportDate", [])
             primary_docs = recent_filings.get("primaryDocument", [])
 
+            # The recent list holds up to 1,000 filings of every form type; test
+            # each against a set and resolve the company fields only once.
+            wanted_forms = set(form_types)
+            tickers = submissions.get("tickers")
+            ticker = tickers[0] if tickers else None
+            company_name = submissions.get("name", "")
+
             for i in range(len(forms)):
                 form_type = forms[i]
-                if form_type not in form_types:
+                if form_type not in wanted_forms:
                     continue
+                # Matched filings share one string per form type instead of a
+                # decoded copy each; ticker and company_name are shared already.
+                form_type = sys.intern(form_type)
 
-                filing_date = datetime.strptime(dates[i], "%Y-%m-%d")
+                filing_date = datetime.fromisoformat(dates[i])
 
                 # Apply date filters
                 if start_date and filing_date < start_date:
@@ -426,7 +465,7 @@ class EdgarClient:
 
                 report_date = None
                 if i < len(report_dates) and report_dates[i]:
-                    report_date = datetime.strptime(report_dates[i], "%Y-%m-%d")
+                    report_date = datetime.fromisoformat(report_dates[i])
 
                 primary_doc = primary_docs[i] if i < len(primary_docs) else None
 
@@ -437,12 +476,8 @@ class EdgarClient:
                     filing_date=filing_date,
                     report_date=report_date,
                     primary_document=primary_doc,
-                    ticker=(
-                        submissions.get("tickers", [None])[0]
-                        if submissions.get("tickers")
-                        else None
-                    ),
-                    company_name=submissions.get("name", ""),
+                    ticker=ticker,
+                    company_name=company_name,
                 )
 
                 # Build document URLs
@@ -570,12 +605,12 @@ class EdgarClient:
         logger.info(f"Downloading {url} to {local_path}")
 
         try:
-            response = self._make_request(url, stream=True)
-
-            with open(local_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Closing the streamed response hands the connection back to the pool
+            with self._make_request(url, stream=True) as response:
+                with open(local_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
 
             logger.info(f"Successfully downloaded to {local_path}")
             return True
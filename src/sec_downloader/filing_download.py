@@ -4,18 +4,19 @@ Filing download functionality with progress tracking and parallel processing.
 
 import json
 import logging
+import os
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from tqdm import tqdm
 import zipfile
 import shutil
 
 from .models import Filing, DownloadConfig, DownloadResult
 from .edgar_client import EdgarClient
-from .utils import ensure_directory, create_safe_filename, get_file_size_mb
+from .utils import ensure_directory, create_safe_filename
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,11 @@ class FilingDownload:
     Handles downloading of SEC filings with progress tracking and parallel processing.
     """
 
+    # Bytes read from each HTML document when sanity-checking downloads
+    HTML_VERIFY_BYTES = 64 * 1024
+    # Document types counted towards the download summary size
+    SUMMARY_SUFFIXES = (".htm", ".html", ".xml")
+
     def __init__(self, edgar_client: Optional[EdgarClient] = None):
         """
         Initialize filing downloader.
@@ -155,7 +161,11 @@ class FilingDownload:
         logger.info(f"Extracted ixviewer bundle to {target_dir}")
 
     def download_filings(
-        self, filings: List[Filing], config: DownloadConfig, show_progress: bool = True
+        self,
+        filings: List[Filing],
+        config: DownloadConfig,
+        show_progress: bool = True,
+        on_result: Optional[Callable[[DownloadResult], None]] = None,
     ) -> List[DownloadResult]:
         """
         Download multiple filings with progress tracking.
@@ -164,6 +174,8 @@ class FilingDownload:
             filings: List of Filing objects to download
             config: Download configuration
             show_progress: Whether to show progress bar
+            on_result: Optional callback invoked with each result as soon as its
+                download finishes, letting callers start downstream work early
 
         Returns:
             List of DownloadResult objects
@@ -191,7 +203,6 @@ class FilingDownload:
                 filing = future_to_filing[future]
                 try:
                     result = future.result()
-                    results.append(result)
 
                     if progress_bar:
                         status = "✓" if result.success else "✗"
@@ -202,16 +213,18 @@ class FilingDownload:
                     logger.error(
                         f"Unexpected error downloading {filing.display_name}: {e}"
                     )
-                    results.append(
-                        DownloadResult(
-                            filing=filing, success=False, error=f"Unexpected error: {e}"
-                        )
+                    result = DownloadResult(
+                        filing=filing, success=False, error=f"Unexpected error: {e}"
                     )
 
                     if progress_bar:
                         progress_bar.set_postfix_str(f"✗ {filing.display_name}")
                         progress_bar.update(1)
 
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
         if progress_bar:
             progress_bar.close()
 
@@ -359,25 +372,54 @@ class FilingDownload:
         """
         for file_path in file_paths:
             path = Path(file_path)
-            if not path.exists():
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
                 raise FilingDownloadError(f"Downloaded file not found: {file_path}")
 
-            if path.stat().st_size == 0:
+            if size == 0:
                 raise FilingDownloadError(f"Downloaded file is empty: {file_path}")
 
-            # Basic content validation for HTML files
+            # Basic content validation for HTML files. Only the head is read: a
+            # multi-megabyte 10-K does not need decoding to prove it is not empty.
             if path.suffix.lower() in [".htm", ".html"]:
                 try:
-                    content = path.read_text(encoding="utf-8", errors="ignore")
-                    if len(content.strip()) < 100:
-                        raise FilingDownloadError(
-                            f"HTML file appears to be incomplete: {file_path}"
+                    with path.open("rb") as handle:
+                        head = handle.read(self.HTML_VERIFY_BYTES)
+                    if size <= len(head) and len(head.strip()) < 100:
+                        logger.warning(
+                            f"Could not verify HTML content for {file_path}: "
+                            "HTML file appears to be incomplete"
                         )
-                except Exception as e:
+                except OSError as e:
                     logger.warning(
                         f"Could not verify HTML content for {file_path}: {e}"
                     )
 
+    def _directory_size_mb(self, directory: Path) -> float:
+        """
+        Sum the size of filing documents (HTML/XML) directly inside a directory.
+
+        Uses a single scandir pass so each size comes from the directory entry
+        instead of separate glob, exists and stat calls per file.
+
+        Args:
+            directory: Filing directory to measure
+
+        Returns:
+            Total size in MB
+        """
+        total_bytes = 0
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(self.SUMMARY_SUFFIXES) and entry.is_file():
+                        total_bytes += entry.stat().st_size
+        except OSError as e:
+            logger.warning(f"Could not measure downloads in {directory}: {e}")
+
+        return total_bytes / (1024 * 1024)
+
     def get_download_summary(self, results: List[DownloadResult]) -> Dict[str, Any]:
         """
         Generate download summary statistics.
@@ -397,9 +439,7 @@ class FilingDownload:
 
         for result in results:
             if result.success and result.local_path:
-                for file_pattern in ["*.htm", "*.html", "*.xml"]:
-                    for file_path in result.local_path.glob(file_pattern):
-                        total_size_mb += get_file_size_mb(file_path)
+                total_size_mb += self._directory_size_mb(result.local_path)
 
         summary = {
             "total_filings": total,
@@ -91,6 +91,11 @@ class Filing:
             )
         return f"https://www.sec.gov/Archives/edgar/data/{self.cik_padded}"
 
+    @property
+    def period_date(self) -> str:
+        """Return the report date (or filing date) as YYYY-MM-DD for file naming."""
+        return (self.report_date or self.filing_date).strftime("%Y-%m-%d")
+
     @property
     def display_name(self) -> str:
         """Return display name for this filing."""
@@ -120,12 +125,9 @@ class DownloadConfig:
             return self.output_dir
 
         ticker = filing.ticker or f"CIK_{filing.cik}"
-        date_str = (
-            filing.report_date.strftime("%Y-%m-%d")
-            if filing.report_date
-            else filing.filing_date.strftime("%Y-%m-%d")
+        filing_dir = (
+            self.output_dir / ticker / f"{filing.form_type}_{filing.period_date}"
         )
-        filing_dir = self.output_dir / ticker / f"{filing.form_type}_{date_str}"
 
         return filing_dir
 
@@ -168,7 +168,8 @@ class RateLimiter:
         Wait if rate limit would be exceeded.
         """
         with self._lock:
-            now = time.time()
+            # Monotonic time keeps the window intact across wall-clock adjustments
+            now = time.monotonic()
 
             # Remove old requests outside the time window
             self.requests = [
@@ -181,7 +182,7 @@ class RateLimiter:
                 sleep_time = self.time_window - (now - self.requests[0]) + 0.1
                 if sleep_time > 0:
                     time.sleep(sleep_time)
-                    now = time.time()
+                    now = time.monotonic()
                     self.requests = [
                         req_time
                         for req_time in self.requests
@@ -0,0 +1,38 @@
+"""Tests for ArelleProcessor environment checks."""
+
+import subprocess
+
+from src.processor import arelle_processor
+from src.processor.arelle_processor import ArelleProcessor
+
+
+def test_check_arelle_available_probes_once_per_process(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="--save-viewer", stderr="")
+
+    monkeypatch.setattr(arelle_processor, "_arelle_available", False)
+    monkeypatch.setattr(arelle_processor.subprocess, "run", fake_run)
+
+    assert ArelleProcessor(tmp_path).check_arelle_available() is True
+    probes = len(calls)
+    assert ArelleProcessor(tmp_path / "other").check_arelle_available() is True
+
+    assert probes > 0
+    assert len(calls) == probes
+
+
+def test_check_arelle_available_retries_after_failure(tmp_path, monkeypatch):
+    results = iter([1, 0, 0])
+
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, next(results), stdout="", stderr="")
+
+    monkeypatch.setattr(arelle_processor, "_arelle_available", False)
+    monkeypatch.setattr(arelle_processor.subprocess, "run", fake_run)
+
+    processor = ArelleProcessor(tmp_path)
+    assert processor.check_arelle_available() is False
+    assert processor.check_arelle_available() is True
@@ -0,0 +1,318 @@
+"""Tests for the combined download + render workflow helpers."""
+
+import argparse
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import download_and_render as workflow
+import render_viewer_to_xlsx as renderer
+from sec_downloader.models import DownloadResult, Filing
+
+
+def _make_filing(
+    accession: str, filing_date: datetime = datetime(2024, 1, 29)
+) -> Filing:
+    return Filing(
+        cik="1318605",
+        accession_number=accession,
+        form_type="10-K",
+        filing_date=filing_date,
+        report_date=datetime(filing_date.year - 1, 12, 31),
+        ticker="TSLA",
+        primary_document="tsla-20231231.htm",
+    )
+
+
+def _make_result(
+    tmp_path: Path, accession: str, filing_date: datetime = datetime(2024, 1, 29)
+) -> DownloadResult:
+    filing_dir = tmp_path / "downloads" / accession
+    filing_dir.mkdir(parents=True)
+    (filing_dir / "tsla-20231231.htm").write_text("<html>ixbrl</html>")
+    return DownloadResult(
+        filing=_make_filing(accession, filing_date),
+        success=True,
+        local_path=filing_dir,
+    )
+
+
+def _make_args(tmp_path: Path, argv=None) -> argparse.Namespace:
+    return workflow.parse_args(
+        [
+            "--ticker",
+            "TSLA",
+            "--excel-dir",
+            str(tmp_path / "output"),
+            "--render-temp-dir",
+            str(tmp_path / "tmp"),
+        ]
+        + list(argv or [])
+    )
+
+
+def _render_all(results, args):
+    with workflow.RenderQueue(args) as render_queue:
+        for result in results:
+            render_queue.submit(result)
+        return render_queue.collect()
+
+
+def test_render_queue_isolates_temp_dirs(tmp_path, monkeypatch):
+    """Concurrent renders must each receive a distinct Arelle scratch directory."""
+    results = [
+        _make_result(tmp_path, "0001628280-24-002390"),
+        _make_result(tmp_path, "0000950170-23-001409", datetime(2023, 1, 31)),
+    ]
+    args = _make_args(tmp_path, ["--render-workers", "2"])
+
+    seen_temp_dirs = []
+
+    def fake_process_filing(render_args):
+        seen_temp_dirs.append(render_args.temp_dir)
+        # ExcelGenerator creates the workbook's directory, as the real render does
+        render_args.out.parent.mkdir(parents=True, exist_ok=True)
+        render_args.out.write_text("xlsx")
+
+    monkeypatch.setattr(renderer, "process_filing", fake_process_filing)
+
+    generated = _render_all(results, args)
+
+    assert len(generated) == 2
+    assert all(path.exists() for path in generated.values())
+    assert len(set(seen_temp_dirs)) == 2
+    assert all(path.parent == tmp_path / "tmp" for path in seen_temp_dirs)
+
+
+def test_render_queue_skips_failed_downloads(tmp_path, monkeypatch):
+    """Failed downloads are reported and never reach the renderer."""
+    failed = DownloadResult(
+        filing=_make_filing("0001628280-24-002390"), success=False, error="boom"
+    )
+    args = _make_args(tmp_path)
+
+    def fail_process_filing(render_args):
+        raise AssertionError("renderer should not be called")
+
+    monkeypatch.setattr(renderer, "process_filing", fail_process_filing)
+
+    assert _render_all([failed], args) == {}
+
+
+def test_determine_filing_input_prefers_ixbrl_zip(tmp_path):
+    """Inline XBRL packages win over the primary HTML document."""
+    result = _make_result(tmp_path, "0001628280-24-002390")
+    for name in ("b-xbrl.zip", "a_ixbrl.zip", "other.zip", "R2.htm"):
+        (result.local_path / name).write_text("x")
+
+    assert workflow.determine_filing_input(result) == result.local_path / "a_ixbrl.zip"
+
+
+def test_determine_filing_input_skips_split_reports(tmp_path):
+    """R-file fragments are ignored when a real inline document is present."""
+    result = _make_result(tmp_path, "0001628280-24-002390")
+    result.filing.primary_document = "R1.htm"
+    (result.local_path / "R1.htm").write_text("x")
+    (result.local_path / "tsla-20231231.htm").unlink()
+    (result.local_path / "tsla-10k.html").write_text("x")
+
+    assert (
+        workflow.determine_filing_input(result) == result.local_path / "tsla-10k.html"
+    )
+
+
+def test_collect_filings_issues_one_search_per_identifier():
+    """10-K and 10-Q limits are applied locally to a single combined search."""
+
+    class StubSearch:
+        def __init__(self):
+            self.calls = []
+
+        def search(self, identifier, filters):
+            self.calls.append(list(filters.form_types))
+            quarterlies = [
+                Filing("1", f"q-{i}", "10-Q", datetime(2024, 12 - i, 1))
+                for i in range(4)
+            ]
+            annuals = [
+                Filing("1", "k-0", "10-K/A", datetime(2024, 2, 15)),
+                Filing("1", "k-1", "10-K", datetime(2024, 1, 30)),
+                Filing("1", "k-2", "10-K", datetime(2023, 1, 30)),
+            ]
+            return quarterlies + annuals
+
+    search = StubSearch()
+    filings = workflow.collect_filings_for_identifier(
+        "TSLA", search, [("10-K", 2), ("10-Q", 3)], True, None, None
+    )
+
+    assert search.calls == [["10-K", "10-Q"]]
+    assert [f.accession_number for f in filings] == [
+        "q-0",
+        "q-1",
+        "q-2",
+        "k-0",
+        "k-1",
+    ]
+
+
+def test_parse_date_string_accepts_iso_dates():
+    assert workflow.parse_date_string("2024-03-31") == datetime(2024, 3, 31)
+    assert workflow.parse_date_string("2024-1-5") == datetime(2024, 1, 5)
+    assert workflow.parse_date_string(None) is None
+
+
+@pytest.mark.parametrize(
+    "value", ["03/31/2024", "2024-01-01T00:00+00:00", "20240331", "2024-W01-1"]
+)
+def test_parse_date_string_rejects_invalid_dates(value):
+    with pytest.raises(ValueError, match="Use YYYY-MM-DD"):
+        workflow.parse_date_string(value)
+
+
+def test_normalize_identifiers_dedupes_case_insensitively(tmp_path):
+    watchlist = tmp_path / "watchlist.txt"
+    watchlist.write_text("# portfolio\nnflx\nTSLA\nAAPL\n")
+    args = workflow.parse_args(["--input-file", str(watchlist)])
+    args.ticker = ["tsla", " NFLX "]
+
+    assert workflow.normalize_identifiers(args) == ["tsla", "NFLX", "AAPL"]
+
+
+def test_read_identifier_file_handles_empty_file(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+
+    assert workflow.read_identifier_file(empty) == []
+
+
+def test_build_excel_path_uses_report_date_and_accession(tmp_path):
+    filing = _make_filing("0001628280-24-002390")
+
+    path = workflow.build_excel_path(tmp_path, filing)
+
+    assert path == tmp_path / "TSLA" / "10-K_2023-12-31_000162828024002390.xlsx"
+
+
+def test_find_meta_links_orders_root_before_ixviewer(tmp_path):
+    (tmp_path / "ixviewer").mkdir()
+    (tmp_path / "ixviewer" / "MetaLinks.json").write_text("{}")
+    (tmp_path / "metalink.json").write_text("{}")
+    (tmp_path / "MetaLinks.json").write_text("{}")
+
+    assert workflow.find_meta_links(tmp_path) == [
+        tmp_path / "MetaLinks.json",
+        tmp_path / "metalink.json",
+        tmp_path / "ixviewer" / "MetaLinks.json",
+    ]
+
+
+def test_find_meta_links_without_ixviewer_bundle(tmp_path):
+    assert workflow.find_meta_links(tmp_path) == []
+
+
+def test_prefetch_files_ignores_missing_paths(tmp_path):
+    existing = tmp_path / "filing.htm"
+    existing.write_text("<html></html>")
+
+    workflow.prefetch_files([existing, tmp_path / "missing.json"])
+
+
+def test_render_filing_skips_existing_workbook_before_scanning(tmp_path, monkeypatch):
+    result = _make_result(tmp_path, "0001628280-24-002390")
+    args = _make_args(tmp_path)
+    excel_path = workflow.build_excel_path(args.excel_dir, result.filing)
+    excel_path.parent.mkdir(parents=True)
+    excel_path.write_text("xlsx")
+
+    def fail_determine(_result):
+        raise AssertionError("input discovery should be skipped")
+
+    monkeypatch.setattr(workflow, "determine_filing_input", fail_determine)
+
+    rendered = workflow.render_filing(
+        result, args, workflow.build_render_template(args)
+    )
+
+    assert rendered == excel_path
+
+
+def test_determine_filing_input_uses_primary_document(tmp_path):
+    """The recorded primary document wins over other inline candidates."""
+    result = _make_result(tmp_path, "0001628280-24-002390")
+    (result.local_path / "a-exhibit.htm").write_text("x")
+
+    assert (
+        workflow.determine_filing_input(result)
+        == result.local_path / "tsla-20231231.htm"
+    )
+
+
+def test_determine_filing_input_falls_back_to_smallest_name(tmp_path):
+    """A missing primary document falls back to the smallest .htm, any case."""
+    result = _make_result(tmp_path, "0001628280-24-002390")
+    (result.local_path / "tsla-20231231.htm").unlink()
+    for name in ("R2.htm", "R1.HTM"):
+        (result.local_path / name).write_text("x")
+
+    assert workflow.determine_filing_input(result) == result.local_path / "R1.HTM"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_viewer_json_round_trips(tmp_path, monkeypatch, use_orjson):
+    """The saved payload is the same JSON whichever encoder is available."""
+    if not use_orjson:
+        monkeypatch.setattr(renderer, "orjson", None)
+    elif renderer.orjson is None:
+        pytest.skip("orjson not installed")
+
+    viewer_data = {"facts": {"f1": {"v": "1", "a": {"c": "us-gaap:Revenue"}}}}
+    output_path = tmp_path / "out" / "viewer.json"
+
+    renderer._dump_viewer_json(viewer_data, output_path)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == viewer_data
+
+
+def test_dump_role_map_orders_roles_and_keeps_columns(tmp_path):
+    role_map = {
+        "http://example.com/role/Unordered": {"r_id": "R9", "longName": "x"},
+        "http://example.com/role/Operations": {"r_id": "R4", "order": 2},
+        "http://example.com/role/BalanceSheet": {"r_id": "R2", "order": 1},
+    }
+    output_path = tmp_path / "roles.csv"
+
+    renderer._dump_role_map(role_map, output_path)
+
+    rows = list(csv.reader(output_path.open(encoding="utf-8")))
+    assert rows[0][:2] == ["role_uri", "r_id"]
+    assert [row[1] for row in rows[1:]] == ["R2", "R4", "R9"]
+    assert rows[3][4] == "x"
+
+
+def test_sibling_meta_links_lists_existing_files_once(tmp_path):
+    filing = tmp_path / "tsla-20231231.htm"
+    filing.write_text("<html></html>")
+    (tmp_path / "metalink.json").write_text("{}")
+    (tmp_path / "MetaLinks.json").mkdir()
+
+    assert renderer._sibling_meta_links(filing) == [tmp_path / "metalink.json"]
+    assert renderer._sibling_meta_links(tmp_path / "missing" / "x.htm") == []
+
+
+def test_validate_arguments_requires_filing_file(tmp_path):
+    args = renderer.create_argument_parser().parse_args(
+        ["--filing", str(tmp_path), "--out", str(tmp_path / "out" / "x.xlsx")]
+    )
+
+    with pytest.raises(FileNotFoundError, match="Filing not found"):
+        renderer.validate_arguments(args)
+
+    args.filing = str(tmp_path / "filing.htm")
+    Path(args.filing).write_text("<html></html>")
+    renderer.validate_arguments(args)
+
+    assert (tmp_path / "out").is_dir()
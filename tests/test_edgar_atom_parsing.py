@@ -2,7 +2,9 @@
 
 from datetime import datetime
 
-from src.sec_downloader.edgar_client import EdgarClient
+import pytest
+
+from src.sec_downloader.edgar_client import EdgarClient, EdgarError
 
 
 ATOM_FEED_SAMPLE = """<?xml version="1.0" encoding="utf-8"?>
@@ -78,3 +80,25 @@ def test_search_filings_can_return_amendments(monkeypatch):
     assert len(filings) == 1
     assert filings[0].form_type == "10-K/A"
     assert filings[0].filing_date == datetime(2023, 2, 13)
+
+
+def test_ticker_index_failure_is_remembered(monkeypatch):
+    """A failed ticker index download is not retried on every lookup."""
+    client = EdgarClient()
+    calls = []
+
+    def failing_request(url, *args, **kwargs):
+        calls.append(url)
+        raise EdgarError("sec.gov unavailable")
+
+    monkeypatch.setattr(client, "_make_request", failing_request)
+
+    for _ in range(2):
+        with pytest.raises(EdgarError, match="sec.gov unavailable"):
+            client.lookup_company_by_ticker("TSLA")
+    assert len(calls) == 3
+
+    monkeypatch.setattr(client, "TICKER_INDEX_RETRY_SECONDS", 0.0)
+    with pytest.raises(EdgarError):
+        client.lookup_company_by_ticker("TSLA")
+    assert len(calls) == 6
@@ -0,0 +1,54 @@
+"""Tests for FilingDownload helpers that do not touch the network."""
+
+from datetime import datetime
+
+import pytest
+
+from src.sec_downloader.filing_download import FilingDownload, FilingDownloadError
+from src.sec_downloader.models import DownloadResult, Filing
+
+
+def test_verify_downloads_rejects_missing_and_empty_files(tmp_path):
+    downloader = FilingDownload(edgar_client=object())
+    empty = tmp_path / "empty.htm"
+    empty.write_bytes(b"")
+
+    with pytest.raises(FilingDownloadError, match="not found"):
+        downloader._verify_downloads([str(tmp_path / "missing.htm")])
+
+    with pytest.raises(FilingDownloadError, match="empty"):
+        downloader._verify_downloads([str(empty)])
+
+
+def test_verify_downloads_reads_only_html_head(tmp_path, caplog):
+    downloader = FilingDownload(edgar_client=object())
+    large = tmp_path / "tsla-20231231.htm"
+    large.write_bytes(b"<html>" + b"x" * (FilingDownload.HTML_VERIFY_BYTES * 2))
+    stub = tmp_path / "stub.htm"
+    stub.write_bytes(b"<html></html>")
+
+    downloader._verify_downloads([str(large), str(stub)])
+
+    warnings = [record.getMessage() for record in caplog.records]
+    assert len(warnings) == 1
+    assert "stub.htm" in warnings[0]
+
+
+def test_download_summary_sizes_only_filing_documents(tmp_path):
+    downloader = FilingDownload(edgar_client=object())
+    (tmp_path / "filing.htm").write_bytes(b"x" * 1024 * 1024)
+    (tmp_path / "exhibit.html").write_bytes(b"x" * 512 * 1024)
+    (tmp_path / "FilingSummary.xml").write_bytes(b"x" * 512 * 1024)
+    (tmp_path / "package.zip").write_bytes(b"x" * 4 * 1024 * 1024)
+    (tmp_path / "nested.htm").mkdir()
+    result = DownloadResult(
+        filing=Filing("1", "0001-24-000001", "10-K", datetime(2024, 1, 31)),
+        success=True,
+        local_path=tmp_path,
+        downloaded_files=["filing.htm", "exhibit.html", "FilingSummary.xml"],
+    )
+
+    summary = downloader.get_download_summary([result])
+
+    assert summary["total_size_mb"] == 2.0
+    assert summary["total_files_downloaded"] == 3
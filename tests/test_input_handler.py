@@ -0,0 +1,108 @@
+"""Tests for InputHandler filing sources."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.processor import input_handler
+from src.processor.input_handler import (
+    InputHandler,
+    LocalFileSource,
+    URLSource,
+    ZipSource,
+)
+
+
+def test_zip_source_picks_largest_html_document(tmp_path):
+    archive = tmp_path / "filing.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("R1.htm", "<html>r</html>")
+        zf.writestr("tsla-20231231.htm", "<html>" + "x" * 2048 + "</html>")
+        zf.writestr("exhibit.html", "<html>" + "x" * 512 + "</html>")
+        zf.writestr("FilingSummary.xml", "x" * 8192)
+
+    source = ZipSource(str(archive), tmp_path / "work")
+    (tmp_path / "work").mkdir()
+
+    assert source.get_path() == str(source.extract_dir / "tsla-20231231.htm")
+
+
+def test_zip_source_ignores_files_from_earlier_extractions(tmp_path):
+    archive = tmp_path / "filing.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("tsla-20231231.htm", "<html>ixbrl</html>")
+
+    source = ZipSource(str(archive), tmp_path)
+    stale_dir = tmp_path / f"extract_{hash(str(archive)) % 10000}"
+    stale_dir.mkdir()
+    (stale_dir / "old-filing.htm").write_text("<html>" + "x" * 4096 + "</html>")
+
+    assert source.get_path() == str(stale_dir / "tsla-20231231.htm")
+
+
+def test_zip_source_without_html_raises(tmp_path):
+    archive = tmp_path / "filing.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("FilingSummary.xml", "<xml/>")
+
+    source = ZipSource(str(archive), tmp_path)
+
+    with pytest.raises(ValueError, match="No HTML files"):
+        source.get_path()
+
+
+def test_sources_reject_missing_paths(tmp_path):
+    assert not LocalFileSource(tmp_path / "missing.htm").validate()
+    assert not LocalFileSource(tmp_path).validate()
+    assert not ZipSource(tmp_path / "missing.zip").validate()
+
+
+def test_url_sources_share_one_session(tmp_path, monkeypatch):
+    requested = []
+
+    class StubResponse:
+        content = b"<html>ixbrl</html>"
+
+        def raise_for_status(self):
+            pass
+
+    class StubSession:
+        def get(self, url, timeout):
+            requested.append(url)
+            return StubResponse()
+
+    session = StubSession()
+    monkeypatch.setattr(input_handler, "_get_session", lambda: session)
+
+    for name in ("a.htm", "b.htm"):
+        source = URLSource(f"https://www.sec.gov/Archives/{name}", tmp_path)
+        assert source.get_path() == source.get_path()
+
+    assert requested == [
+        "https://www.sec.gov/Archives/a.htm",
+        "https://www.sec.gov/Archives/b.htm",
+    ]
+
+
+def test_validate_filing_sniffs_document_head(tmp_path):
+    handler = InputHandler(tmp_path)
+    filing = tmp_path / "filing.htm"
+    filing.write_text('<HTML xmlns:ix="http://www.xbrl.org/2013/inlineXBRL">')
+    other = tmp_path / "notes.txt"
+    other.write_bytes(b"plain text\xff" + b"x" * 20000 + b"<html>")
+
+    assert handler.validate_filing(filing)
+    assert not handler.validate_filing(other)
+    assert not handler.validate_filing(tmp_path / "missing.htm")
+
+
+def test_local_path_starting_with_http_is_not_a_url(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Path("httpfiling.htm").write_text("<html></html>")
+
+    assert InputHandler.is_url("https://www.sec.gov/Archives/x.htm")
+    assert not InputHandler.is_url("httpfiling.htm")
+    assert isinstance(
+        InputHandler(tmp_path).create_source("httpfiling.htm"), LocalFileSource
+    )
@@ -1,5 +1,6 @@
 """Integration coverage for presentation-first pipeline."""
 
+import copy
 import json
 from pathlib import Path
 
@@ -179,3 +180,45 @@ def test_scale_hint_affects_raw_values(integration_viewer_data):
     assert scaled_value is not None and unscaled_value is not None
     assert scaled_value != unscaled_value
     assert abs(unscaled_value) > abs(scaled_value)
+
+
+def test_parallel_statement_matching_matches_serial(integration_viewer_data):
+    """Statements matched in worker processes come back complete and in order."""
+    viewer_data = copy.deepcopy(integration_viewer_data)
+    target = viewer_data["sourceReports"][0]["targetReports"][0]
+    pres = target["rels"]["pres"]
+    for index in (2, 3):
+        target["roleDefs"][f"ns{index}"] = {
+            "label": f"0000000{index} - Statement - BALANCE SHEETS {index}",
+            "uri": f"http://example.com/role/BalanceSheet{index}",
+        }
+        role = copy.deepcopy(pres["ns1"])
+        role["elrs"] = {
+            f"http://example.com/role/BalanceSheet{index}": next(
+                iter(role["elrs"].values())
+            )
+        }
+        pres[f"ns{index}"] = role
+
+    def summarize(result):
+        return [
+            (
+                statement.name,
+                [period.label for period in statement.periods],
+                [
+                    (row.label, [cell.value for cell in row.cells.values()])
+                    for row in statement.rows
+                ],
+            )
+            for statement in result.statements
+        ]
+
+    serial = DataParser(ValueFormatter(scale_millions=False)).parse_viewer_data(
+        viewer_data
+    )
+    parallel = DataParser(
+        ValueFormatter(scale_millions=False), parse_workers=2
+    ).parse_viewer_data(viewer_data)
+
+    assert len(serial.statements) == 3
+    assert summarize(parallel) == summarize(serial)
@@ -0,0 +1,39 @@
+"""Tests for ViewerDataExtractor MetaLinks loading."""
+
+import json
+
+import pytest
+
+from src.processor import json_extractor
+from src.processor.json_extractor import ViewerDataExtractor
+
+
+META_LINKS = {"instance": {"filing.htm": {"report": {}, "tag": {}}}}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_meta_links_prefers_sibling_file(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_extractor, "orjson", None)
+    viewer_html = tmp_path / "viewer" / "filing.htm"
+    viewer_html.parent.mkdir()
+    (viewer_html.parent / "MetaLinks.json").write_text(json.dumps(META_LINKS))
+    fallback = tmp_path / "fallback.json"
+    fallback.write_text("{}")
+
+    loaded = ViewerDataExtractor()._load_meta_links(viewer_html, [fallback])
+
+    assert loaded == META_LINKS
+
+
+def test_load_meta_links_skips_unparseable_candidates(tmp_path):
+    viewer_html = tmp_path / "viewer" / "filing.htm"
+    viewer_html.parent.mkdir()
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+    valid = tmp_path / "valid.json"
+    valid.write_text(json.dumps(META_LINKS))
+
+    loaded = ViewerDataExtractor()._load_meta_links(viewer_html, [broken, valid])
+
+    assert loaded == META_LINKS
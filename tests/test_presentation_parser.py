@@ -6,6 +6,8 @@ Tests the complete presentation parsing pipeline that extracts presentation
 structure from viewer JSON and matches facts to create statement tables.
 """
 
+import copy
+import dataclasses
 import json
 import pytest
 from pathlib import Path
@@ -70,6 +72,75 @@ class TestPresentationParser:
         assert balance_sheet.role_id == "ns9"
         assert len(balance_sheet.root_nodes) > 0
 
+    def test_statement_filter_runs_before_trees_are_built(self, monkeypatch):
+        """Statements dropped by the filter never have their trees built."""
+        seen = []
+        built = []
+        original_build = self.parser._build_statement_trees
+
+        def record_build(statement, *args):
+            built.append(statement.role_id)
+            return original_build(statement, *args)
+
+        def drop_all_but_first(statements):
+            seen.extend(statement.root_nodes for statement in statements)
+            return statements[:1]
+
+        monkeypatch.setattr(self.parser, "_build_statement_trees", record_build)
+        statements = self.parser.parse_presentation_statements(
+            self.mock_viewer_json, statement_filter=drop_all_but_first
+        )
+
+        assert seen and all(root_nodes == [] for root_nodes in seen)
+        assert built == ["ns9"]
+        assert [statement.role_id for statement in statements] == ["ns9"]
+        assert statements[0].root_nodes
+
+    def _viewer_with_two_roles(self):
+        """Viewer JSON with the balance sheet relationships under ns9 and ns10."""
+        viewer_json = copy.deepcopy(self.mock_viewer_json)
+        pres = viewer_json["sourceReports"][0]["targetReports"][0]["rels"]["pres"]
+        pres["ns10"] = copy.deepcopy(pres["ns9"])
+        return viewer_json
+
+    def _fail_build_for(self, monkeypatch, failing_role):
+        original_build = self.parser._build_statement_trees
+
+        def build(statement, *args):
+            if statement.role_id == failing_role:
+                raise ValueError(f"No valid presentation trees for {failing_role}")
+            return original_build(statement, *args)
+
+        monkeypatch.setattr(self.parser, "_build_statement_trees", build)
+
+    def test_statement_filter_keeps_roles_that_build(self, monkeypatch):
+        """A kept role whose tree fails is dropped without losing the others."""
+        self._fail_build_for(monkeypatch, "ns10")
+
+        statements = self.parser.parse_presentation_statements(
+            self._viewer_with_two_roles(),
+            statement_filter=lambda statements: [
+                dataclasses.replace(statement) for statement in statements
+            ],
+        )
+
+        assert [statement.role_id for statement in statements] == ["ns9"]
+        assert statements[0].root_nodes
+
+    def test_statement_filter_falls_back_when_no_kept_role_builds(self, monkeypatch):
+        """If every kept role fails to build, the buildable statements are returned."""
+        self._fail_build_for(monkeypatch, "ns10")
+
+        statements = self.parser.parse_presentation_statements(
+            self._viewer_with_two_roles(),
+            statement_filter=lambda statements: [
+                statement for statement in statements if statement.role_id == "ns10"
+            ],
+        )
+
+        assert [statement.role_id for statement in statements] == ["ns9"]
+        assert statements[0].root_nodes
+
     def test_is_financial_statement_role(self):
         """Test identifying financial statement roles."""
         # Test various role types
@@ -0,0 +1,81 @@
+"""Tests for the on-disk viewer data cache."""
+
+from src.processor import viewer_cache
+from src.processor.viewer_cache import ViewerCache
+
+
+def test_round_trip_by_content_key(tmp_path):
+    filing = tmp_path / "filing.htm"
+    filing.write_text("<html>ixbrl</html>")
+    cache = ViewerCache(tmp_path / "cache")
+
+    key = cache.make_key(filing)
+    assert cache.load(key) is None
+
+    cache.store(key, {"sourceReports": [{"targetReports": []}]})
+
+    assert cache.load(key) == {"sourceReports": [{"targetReports": []}]}
+    assert list((tmp_path / "cache").iterdir()) == [tmp_path / "cache" / f"{key}.json"]
+
+
+def test_key_tracks_filing_and_meta_links_content(tmp_path):
+    filing = tmp_path / "filing.htm"
+    filing.write_text("<html>v1</html>")
+    meta_links = tmp_path / "MetaLinks.json"
+    meta_links.write_text("{}")
+    cache = ViewerCache(tmp_path / "cache")
+
+    base_key = cache.make_key(filing)
+    with_meta_key = cache.make_key(filing, [meta_links])
+    assert base_key != with_meta_key
+
+    meta_links.write_text('{"instance": {}}')
+    assert cache.make_key(filing, [meta_links]) != with_meta_key
+
+    filing.write_text("<html>v2</html>")
+    assert cache.make_key(filing) != base_key
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path):
+    cache = ViewerCache(tmp_path)
+    (tmp_path / "deadbeef.json").write_text("{not json")
+
+    assert cache.load("deadbeef") is None
+
+
+def test_key_tracks_schema_and_linkbases_beside_filing(tmp_path):
+    filing = tmp_path / "tsla-20231231.htm"
+    filing.write_text("<html>ixbrl</html>")
+    (tmp_path / "tsla-20231231.xsd").write_text("<schema/>")
+    linkbase = tmp_path / "tsla-20231231_pre.xml"
+    cache = ViewerCache(tmp_path / "cache")
+
+    without_linkbase = cache.make_key(filing)
+    linkbase.write_text("<linkbase>v1</linkbase>")
+    with_linkbase = cache.make_key(filing)
+    linkbase.write_text("<linkbase>v2</linkbase>")
+    updated_linkbase = cache.make_key(filing)
+
+    assert len({without_linkbase, with_linkbase, updated_linkbase}) == 3
+
+    # Files outside the DTS do not invalidate the entry
+    (tmp_path / "FilingSummary.xml").write_text("<summary/>")
+    assert cache.make_key(filing) == updated_linkbase
+
+
+def test_key_tracks_arelle_version(tmp_path, monkeypatch):
+    filing = tmp_path / "filing.htm"
+    filing.write_text("<html>ixbrl</html>")
+    cache = ViewerCache(tmp_path / "cache")
+
+    versions = {"arelle-release": "2.28.0", "ixbrl-viewer": "1.4.0"}
+    monkeypatch.setattr(viewer_cache.metadata, "version", versions.__getitem__)
+    viewer_cache._tool_versions.cache_clear()
+    old_key = cache.make_key(filing)
+
+    versions["arelle-release"] = "2.30.0"
+    viewer_cache._tool_versions.cache_clear()
+    new_key = cache.make_key(filing)
+    viewer_cache._tool_versions.cache_clear()
+
+    assert old_key != new_key